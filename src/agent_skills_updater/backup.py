@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import heapq
+import os
+import re
 import shutil
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from agent_skills_updater import jsonio
+
 if TYPE_CHECKING:
     from agent_skills_updater.cli import Context
     from agent_skills_updater.config import AppConfig
     from agent_skills_updater.lockfile import Lockfile
 
+# Copying skill trees is bound by per-file syscall latency, not CPU
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Upper bound on old backups deleted concurrently during retention
+_RMTREE_WORKERS = 8
+
+# shutil.copyfile already uses sendfile/fcopyfile/CopyFile2 where it can; this
+# only widens the read/write loop it falls back to (64 KiB by default on POSIX)
+_COPY_BUFSIZE = 256 * 1024
+if shutil.COPY_BUFSIZE < _COPY_BUFSIZE:
+    shutil.COPY_BUFSIZE = _COPY_BUFSIZE
+
+# Hidden sibling a replaced skill tree is renamed to before being deleted
+_TRASH_RE = re.compile(r"\..+\.old-[0-9a-f]{8}")
+
+# Maps a target path to a single filesystem-safe directory name
+_LABEL_TRANS = str.maketrans({"\\": "_", "/": "_", ":": ""})
+
 
 @dataclass
 class BackupInfo:
@@ -38,9 +63,78 @@ def _backup_dir(config: AppConfig) -> Path:
     return config.backup_path
 
 
-def _timestamp_label() -> str:
+@functools.lru_cache(maxsize=32)
+def _target_label(target_path: str) -> str:
+    """Return the backup subdirectory name used for a skill target path."""
+    return target_path.translate(_LABEL_TRANS)
+
+
+def _timestamp_label(dt: datetime | None = None) -> str:
     """Generate a filesystem-safe UTC timestamp label with microseconds for uniqueness."""
-    return datetime.now(UTC).strftime("%Y%m%dT%H%M%S_%fZ")
+    dt = dt or datetime.now(UTC)
+    # Same as strftime("%Y%m%dT%H%M%S_%fZ") without the locale-aware formatter
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T"
+        f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}_{dt.microsecond:06d}Z"
+    )
+
+
+def _raise(exc: OSError) -> None:
+    """os.walk error handler that propagates the error instead of skipping."""
+    raise exc
+
+
+def _collect_tree(src: str, dst: str) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Walk src once, pairing every directory and file with its path under dst.
+
+    Directories are returned parents-first (os.walk is top-down), so they can be
+    created in order without parents=True checks.
+    """
+    dirs: list[tuple[str, str]] = []
+    files: list[tuple[str, str]] = []
+
+    # followlinks matches copytree(symlinks=False), which copies linked dirs;
+    # unreadable directories fail the copy as they would in copytree
+    for dirpath, _dirnames, filenames in os.walk(src, onerror=_raise, followlinks=True):
+        rel = os.path.relpath(dirpath, src)
+        target_dir = dst if rel == os.curdir else os.path.join(dst, rel)
+        dirs.append((dirpath, target_dir))
+        files.extend(
+            (os.path.join(dirpath, name), os.path.join(target_dir, name)) for name in filenames
+        )
+
+    return dirs, files
+
+
+def _parallel_copytree(
+    src: str | os.PathLike[str],
+    dst: str | os.PathLike[str],
+    workers: int = _COPY_WORKERS,
+) -> None:
+    """Copy a directory tree, spreading the file copies over a thread pool.
+
+    The whole destination tree (including missing parents of dst) is created on
+    the calling thread before any file is copied, so workers only ever copy
+    files. Existing destination directories are reused. Files go through
+    shutil.copy2, which takes the platform's zero-copy path when one is available.
+    """
+    dirs, files = _collect_tree(os.fspath(src), os.fspath(dst))
+
+    for _src_dir, dst_dir in dirs:
+        os.makedirs(dst_dir, exist_ok=True)
+
+    if len(files) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            # Consume the iterator so worker exceptions propagate
+            for _ in pool.map(lambda pair: shutil.copy2(*pair), files):
+                pass
+    else:
+        for src_file, dst_file in files:
+            shutil.copy2(src_file, dst_file)
+
+    # Match copytree: directory metadata is copied after the contents
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
 
 
 def create_backup(config: AppConfig, lockfile: Lockfile) -> BackupInfo | None:
@@ -54,46 +148,43 @@ def create_backup(config: AppConfig, lockfile: Lockfile) -> BackupInfo | None:
     if not lockfile.entries:
         return None
 
-    ts = _timestamp_label()
+    now = datetime.now(UTC)
+    ts = _timestamp_label(now)
     backup_root = _backup_dir(config) / ts
     backup_root.mkdir(parents=True, exist_ok=True)
 
-    backed_up_skills: list[str] = []
+    backed_up: set[str] = set()
+    wanted = set(lockfile.entries)
 
     for target_path in config.skill_target_paths:
         if not target_path.is_dir():
             continue
 
         # Create a subdirectory per target to avoid collisions
-        target_label = str(target_path).replace("\\", "_").replace("/", "_").replace(":", "")
-        dest = backup_root / target_label
-
-        for skill_name in lockfile.entries:
-            skill_dir = target_path / skill_name
-            if skill_dir.is_dir():
-                skill_dest = dest / skill_name
-                skill_dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copytree(skill_dir, skill_dest, dirs_exist_ok=True)
-                if skill_name not in backed_up_skills:
-                    backed_up_skills.append(skill_name)
+        target_path_str = os.fspath(target_path)
+        dest = os.path.join(backup_root, _target_label(target_path_str))
+
+        # One directory listing per target instead of a stat per tracked skill
+        with os.scandir(target_path_str) as it:
+            skill_entries = [e for e in it if e.name in wanted and e.is_dir()]
+
+        for entry in skill_entries:
+            _parallel_copytree(entry.path, os.path.join(dest, entry.name))
+            backed_up.add(entry.name)
+
+    backed_up_skills = sorted(backed_up)
 
     # Save lockfile snapshot
     lockfile_snapshot = backup_root / "lockfile.json"
-    lockfile_snapshot.write_text(
-        json.dumps(lockfile.to_dict(), indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    lockfile_snapshot.write_bytes(jsonio.dumps(lockfile.to_dict(), indent=True))
 
     # Save metadata
     meta = {
         "timestamp": ts,
-        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "created": now.isoformat(timespec="seconds"),
         "skills": backed_up_skills,
     }
-    (backup_root / "backup-meta.json").write_text(
-        json.dumps(meta, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    (backup_root / "backup-meta.json").write_bytes(jsonio.dumps(meta, indent=True))
 
     # Enforce retention limit
     _enforce_retention(config)
@@ -106,20 +197,76 @@ def create_backup(config: AppConfig, lockfile: Lockfile) -> BackupInfo | None:
     )
 
 
+def _sort_for_io(entries: list[os.DirEntry[str]]) -> list[os.DirEntry[str]]:
+    """Sort directory entries into the order cheapest to visit on disk.
+
+    On POSIX the entries are sorted by inode number, which keeps metadata reads
+    and deletions walking the inode table sequentially. On Windows DirEntry.inode()
+    costs an extra stat per entry, so readdir order is kept there.
+    """
+    if os.name == "posix":
+        entries.sort(key=lambda e: e.inode())
+    return entries
+
+
+def _scan_backup_dirs(root: Path) -> list[os.DirEntry[str]]:
+    """Return the backup directory entries under root, in readdir order."""
+    with os.scandir(root) as it:
+        return [e for e in it if e.is_dir(follow_symlinks=False)]
+
+
+def _backup_dirs_for_io(root: Path) -> list[os.DirEntry[str]]:
+    """Return backup directory entries in the order cheapest to visit on disk."""
+    return _sort_for_io(_scan_backup_dirs(root))
+
+
 def _enforce_retention(config: AppConfig) -> None:
     """Remove old backups exceeding keep_backups limit."""
     root = _backup_dir(config)
     if not root.is_dir():
         return
 
-    backups = sorted(
-        [d for d in root.iterdir() if d.is_dir()],
-        key=lambda d: d.name,
-        reverse=True,
-    )
+    entries = _scan_backup_dirs(root)
+    excess = len(entries) - config.keep_backups
+    if excess <= 0:
+        return
+
+    # Backup names are UTC timestamps, so the smallest names are the oldest
+    oldest = set(heapq.nsmallest(excess, (e.name for e in entries)))
+    to_delete = _sort_for_io([e for e in entries if e.name in oldest])
+
+    if len(to_delete) == 1:
+        shutil.rmtree(to_delete[0].path, ignore_errors=True)
+        return
 
-    for old_backup in backups[config.keep_backups :]:
-        shutil.rmtree(old_backup, ignore_errors=True)
+    # Each rmtree is sequential, but separate backups can be removed concurrently
+    with ThreadPoolExecutor(max_workers=min(_RMTREE_WORKERS, len(to_delete))) as pool:
+        for entry in to_delete:
+            pool.submit(shutil.rmtree, entry.path, ignore_errors=True)
+
+
+def _read_backup_info(backup_dir: Path) -> BackupInfo:
+    """Build BackupInfo for one backup directory from its metadata file."""
+    meta_file = backup_dir / "backup-meta.json"
+    if meta_file.is_file():
+        try:
+            meta = jsonio.loads(meta_file.read_bytes())
+            skills = meta.get("skills", [])
+            return BackupInfo(
+                path=backup_dir,
+                timestamp=meta.get("timestamp", backup_dir.name),
+                skill_count=len(skills),
+                skills=skills,
+            )
+        except (OSError, jsonio.JSONDecodeError):
+            pass
+
+    return BackupInfo(
+        path=backup_dir,
+        timestamp=backup_dir.name,
+        skill_count=0,
+        skills=[],
+    )
 
 
 def list_backups(config: AppConfig) -> list[BackupInfo]:
@@ -128,48 +275,65 @@ def list_backups(config: AppConfig) -> list[BackupInfo]:
     if not root.is_dir():
         return []
 
-    results: list[BackupInfo] = []
+    results = [_read_backup_info(Path(e.path)) for e in _backup_dirs_for_io(root)]
+    results.sort(key=lambda b: b.path.name, reverse=True)
+    return results
 
-    dirs = sorted(
-        [d for d in root.iterdir() if d.is_dir()],
-        key=lambda d: d.name,
-        reverse=True,
-    )
 
-    for backup_dir in dirs:
-        meta_file = backup_dir / "backup-meta.json"
-        if meta_file.is_file():
-            try:
-                meta = json.loads(meta_file.read_text(encoding="utf-8"))
-                skills = meta.get("skills", [])
-                results.append(
-                    BackupInfo(
-                        path=backup_dir,
-                        timestamp=meta.get("timestamp", backup_dir.name),
-                        skill_count=len(skills),
-                        skills=skills,
-                    )
-                )
-            except (OSError, json.JSONDecodeError):
-                results.append(
-                    BackupInfo(
-                        path=backup_dir,
-                        timestamp=backup_dir.name,
-                        skill_count=0,
-                        skills=[],
-                    )
-                )
-        else:
-            results.append(
-                BackupInfo(
-                    path=backup_dir,
-                    timestamp=backup_dir.name,
-                    skill_count=0,
-                    skills=[],
-                )
-            )
+def _latest_backup(config: AppConfig) -> BackupInfo | None:
+    """Return the newest backup, reading only its metadata file."""
+    root = _backup_dir(config)
+    if not root.is_dir():
+        return None
 
-    return results
+    with os.scandir(root) as it:
+        latest = max(
+            (e for e in it if e.is_dir(follow_symlinks=False)),
+            key=lambda e: e.name,
+            default=None,
+        )
+
+    if latest is None:
+        return None
+    return _read_backup_info(Path(latest.path))
+
+
+def _move_aside(path: str) -> str | None:
+    """Rename an existing tree to a hidden sibling so it can be deleted later.
+
+    Returns the new location, or None if there was nothing to move. Trees that
+    cannot be renamed (e.g. a file held open on Windows) are deleted in place.
+    """
+    parent, name = os.path.split(path)
+    trash = os.path.join(parent, f".{name}.old-{os.urandom(4).hex()}")
+    try:
+        os.rename(path, trash)
+    except FileNotFoundError:
+        return None
+    except OSError:
+        shutil.rmtree(path)
+        return None
+    return trash
+
+
+def _leftover_trash(target: str) -> list[str]:
+    """Return trees moved aside by an earlier restore that were never deleted."""
+    try:
+        with os.scandir(target) as it:
+            return [
+                e.path for e in it
+                if _TRASH_RE.fullmatch(e.name) and e.is_dir(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _replace_tree(src: str, dest: str, discard: Callable[[str], None]) -> None:
+    """Replace dest with a copy of src, handing the old tree to discard."""
+    trash = _move_aside(dest)
+    if trash is not None:
+        discard(trash)
+    _parallel_copytree(src, dest)
 
 
 def restore_backup(
@@ -184,51 +348,63 @@ def restore_backup(
 
     Returns True on success.
     """
-    backups = list_backups(config)
-    if not backups:
+    latest = _latest_backup(config)
+    if latest is None:
         return False
 
-    latest = backups[0]
-
     if ctx.verbose:
         ctx.console.print(f"  [dim]Restoring from backup: {latest.timestamp}[/]")
 
     restored_any = False
-
-    for target_path in config.skill_target_paths:
-        target_label = str(target_path).replace("\\", "_").replace("/", "_").replace(":", "")
-        backup_target = latest.path / target_label
-
-        if not backup_target.is_dir():
-            continue
-
-        if skill_name:
-            # Restore single skill
-            skill_backup = backup_target / skill_name
-            if skill_backup.is_dir():
-                dest = target_path / skill_name
-                if not ctx.dry_run:
-                    if dest.exists():
-                        shutil.rmtree(dest)
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copytree(skill_backup, dest)
-                else:
-                    ctx.console.print(f"    [dim]Would restore: {dest}[/]")
-                restored_any = True
-        else:
-            # Restore all skills
-            for skill_dir in backup_target.iterdir():
-                if not skill_dir.is_dir():
-                    continue
-                dest = target_path / skill_dir.name
-                if not ctx.dry_run:
-                    if dest.exists():
-                        shutil.rmtree(dest)
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copytree(skill_dir, dest)
-                else:
-                    ctx.console.print(f"    [dim]Would restore: {dest}[/]")
-                restored_any = True
+    cleanups: list[tuple[str, Future[None]]] = []
+
+    # Replaced skill trees are moved aside and deleted while the copies run;
+    # the executor only starts threads once something is submitted
+    with ThreadPoolExecutor(max_workers=_RMTREE_WORKERS) as cleaner:
+
+        def discard(trash: str) -> None:
+            cleanups.append((trash, cleaner.submit(shutil.rmtree, trash)))
+
+        for target_path in config.skill_target_paths:
+            target_path_str = os.fspath(target_path)
+            backup_target = os.path.join(latest.path, _target_label(target_path_str))
+
+            if not os.path.isdir(backup_target):
+                continue
+
+            # Finish off trees an interrupted restore left behind, listed before
+            # this run moves anything aside so each tree is deleted only once
+            if not ctx.dry_run:
+                for trash in _leftover_trash(target_path_str):
+                    discard(trash)
+
+            if skill_name:
+                # Restore single skill
+                skill_backup = os.path.join(backup_target, skill_name)
+                if os.path.isdir(skill_backup):
+                    dest = os.path.join(target_path_str, skill_name)
+                    if not ctx.dry_run:
+                        _replace_tree(skill_backup, dest, discard)
+                    else:
+                        ctx.console.print(f"    [dim]Would restore: {dest}[/]")
+                    restored_any = True
+            else:
+                # Restore all skills
+                with os.scandir(backup_target) as it:
+                    skill_entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+                for skill_entry in skill_entries:
+                    dest = os.path.join(target_path_str, skill_entry.name)
+                    if not ctx.dry_run:
+                        _replace_tree(skill_entry.path, dest, discard)
+                    else:
+                        ctx.console.print(f"    [dim]Would restore: {dest}[/]")
+                    restored_any = True
+
+    # The restored skills are in place; an old tree that survives is only reported
+    for trash, future in cleanups:
+        exc = future.exception()
+        if exc is not None:
+            ctx.console.print(f"    [yellow]Could not remove {trash}:[/] {exc}")
 
     # Restore lockfile snapshot if restoring all
     if not skill_name and not ctx.dry_run:
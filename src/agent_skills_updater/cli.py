@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
 
 from agent_skills_updater import __version__
 
 if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+    from agent_skills_updater.backup import BackupInfo
     from agent_skills_updater.config import AppConfig
 
 
@@ -28,6 +32,7 @@ class Context:
         trust_all: bool = False,
         json_output: bool = False,
         no_update_check: bool = False,
+        jobs: int | None = None,
     ) -> None:
         self.config_path = config_path
         self.dry_run = dry_run
@@ -36,8 +41,19 @@ class Context:
         self.trust_all = trust_all
         self.json_output = json_output
         self.no_update_check = no_update_check
-        self.console = Console(quiet=json_output)
+        self.jobs = jobs
+        self._console: Console | None = None
         self.config: AppConfig | None = None
+        self._backups_cache: tuple[tuple[int, int], list[BackupInfo]] | None = None
+
+    @property
+    def console(self) -> Console:
+        """Rich console, created on first use so --json runs never import Rich."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(quiet=self.json_output)
+        return self._console
 
     def load_config(self) -> AppConfig:
         """Load and cache the application config."""
@@ -47,10 +63,41 @@ class Context:
             self.config = load_config(self.config_path)
         return self.config
 
+    def list_backups(self) -> list[BackupInfo]:
+        """List backups, reusing the last scan while the backup root is unchanged."""
+        from agent_skills_updater.backup import list_backups
+
+        config = self.load_config()
+        try:
+            key = (os.stat(config.backup_path).st_mtime_ns, config.keep_backups)
+        except OSError:
+            return list_backups(config)
+
+        if self._backups_cache is None or self._backups_cache[0] != key:
+            self._backups_cache = (key, list_backups(config))
+        return self._backups_cache[1]
+
 
 pass_context = click.make_pass_decorator(Context, ensure=True)
 
 
+def _emit_json(obj: object) -> None:
+    """Write obj to stdout as indented, ASCII-escaped JSON, encoding straight to bytes."""
+    from agent_skills_updater import jsonio
+
+    data = jsonio.dumps(obj, indent=True, ensure_ascii=True)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.flush()
+
+
+def _get_table(title: str) -> Table:
+    """Create a Rich table, importing rich.table only when output is rendered."""
+    from rich.table import Table
+
+    return Table(title=title)
+
+
 @click.group(invoke_without_command=True)
 @click.version_option(version=__version__, prog_name="agent-skills-update")
 @click.option(
@@ -68,6 +115,12 @@ pass_context = click.make_pass_decorator(Context, ensure=True)
 )
 @click.option("--json", "json_output", is_flag=True, help="Machine-readable JSON output.")
 @click.option("--no-update-check", is_flag=True, help="Skip checking for new versions.")
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of repositories to download in parallel (default: parallelDownloads or 4).",
+)
 @click.option(
     "--skills",
     default=None,
@@ -83,6 +136,7 @@ def main(
     trust_all: bool,
     json_output: bool,
     no_update_check: bool,
+    jobs: int | None,
     skills: str | None,
 ) -> None:
     """Automated skill management for AI coding assistants.
@@ -105,6 +159,7 @@ def main(
         trust_all=trust_all,
         json_output=json_output,
         no_update_check=no_update_check,
+        jobs=jobs,
     )
     ctx.obj = app_ctx
 
@@ -122,8 +177,8 @@ def _run_update(ctx: Context, skills: str | None) -> None:
     """Execute the default update action."""
     skill_list = [s.strip() for s in skills.split(",") if s.strip()] if skills else None
 
-    config = ctx.load_config()
-
+    # Print the mode banners before loading config or importing the download
+    # stack (requests, rich.progress) so there is immediate feedback.
     if ctx.dry_run:
         ctx.console.print("[bold yellow]Dry run mode[/] - no changes will be made.")
 
@@ -132,9 +187,9 @@ def _run_update(ctx: Context, skills: str | None) -> None:
         if skill_list:
             ctx.console.print(f"[dim]Skills filter: {', '.join(skill_list)}[/]")
 
-    from agent_skills_updater.downloader import download_repos
-    from agent_skills_updater.installer import install_skills
-    from agent_skills_updater.lockfile import load_lockfile, save_lockfile
+    config = ctx.load_config()
+
+    from agent_skills_updater.lockfile import _now_iso, load_lockfile, save_lockfile
 
     lockfile = load_lockfile(config)
 
@@ -143,18 +198,22 @@ def _run_update(ctx: Context, skills: str | None) -> None:
 
         create_backup(config, lockfile)
 
-    results = download_repos(config, ctx)
+    from agent_skills_updater.downloader import download_repos
+
+    results = download_repos(config, ctx, skill_filter=skill_list)
+
+    from agent_skills_updater.installer import install_skills
+
     installed = install_skills(config, results, ctx, skill_filter=skill_list)
 
     if not ctx.dry_run:
+        now = _now_iso()
         for entry in installed:
-            lockfile.update_entry(entry)
+            lockfile.update_entry(entry, now=now)
         save_lockfile(config, lockfile)
 
     if ctx.json_output:
-        import json
-
-        print(json.dumps({"updated": [e.to_dict() for e in installed]}, indent=2))
+        _emit_json({"updated": [e.to_dict() for e in installed]})
     else:
         if installed:
             ctx.console.print(f"\n[bold green]Updated {len(installed)} skill(s).[/]")
@@ -173,9 +232,7 @@ def list(ctx: Context) -> None:
     lockfile = load_lockfile(config)
 
     if ctx.json_output:
-        import json
-
-        print(json.dumps(lockfile.to_dict(), indent=2))
+        _emit_json(lockfile.to_dict())
         return
 
     entries = lockfile.entries
@@ -183,9 +240,7 @@ def list(ctx: Context) -> None:
         ctx.console.print("[dim]No skills installed.[/]")
         return
 
-    from rich.table import Table
-
-    table = Table(title="Installed Skills")
+    table = _get_table("Installed Skills")
     table.add_column("Skill", style="bold cyan")
     table.add_column("Source")
     table.add_column("Installed")
@@ -234,25 +289,17 @@ def rollback(ctx: Context, skill: str | None) -> None:
 @pass_context
 def list_backups(ctx: Context) -> None:
     """Show available backups."""
-    config = ctx.load_config()
-
-    from agent_skills_updater.backup import list_backups as _list_backups
-
-    backups = _list_backups(config)
+    backups = ctx.list_backups()
 
     if ctx.json_output:
-        import json
-
-        print(json.dumps([b.to_dict() for b in backups], indent=2))
+        _emit_json([b.to_dict() for b in backups])
         return
 
     if not backups:
         ctx.console.print("[dim]No backups available.[/]")
         return
 
-    from rich.table import Table
-
-    table = Table(title="Available Backups")
+    table = _get_table("Available Backups")
     table.add_column("Timestamp", style="bold cyan")
     table.add_column("Skills")
     table.add_column("Path")
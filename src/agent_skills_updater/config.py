@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-import platform
+import functools
+import os
+import pickle
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
+from agent_skills_updater import __version__
+
+# Pickled YAML of the last loaded config, stored in the cache directory
+_CONFIG_CACHE_NAME = "config.pickle"
+
+# Bump whenever the pickled payload changes shape, so older pickles are ignored.
+# 2: AppConfig with slotted RepoConfig; 3: the raw YAML mapping, expanded on load
+_CACHE_SCHEMA = 3
+
+# Repository layouts understood by the installer
+_VALID_STRUCTURES: frozenset[str] = frozenset({"standard", "root", "template", "multi"})
 
 # Default config search paths (checked in order)
 _DEFAULT_CONFIG_NAMES = [
@@ -18,7 +31,7 @@ _DEFAULT_CONFIG_NAMES = [
 
 def _default_config_dir() -> Path:
     """Return the platform-appropriate config directory."""
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
         base = Path.home() / "AppData" / "Local"
     else:
         xdg = Path.home() / ".config"
@@ -26,12 +39,49 @@ def _default_config_dir() -> Path:
     return base / "agent-skills-updater"
 
 
-def _expand_path(raw: str) -> Path:
-    """Expand ~ and environment variables in a path string."""
-    return Path(raw).expanduser().resolve()
+def _default_cache_dir() -> Path:
+    """Return the platform-appropriate cache directory."""
+    if sys.platform == "win32":
+        return _default_config_dir() / "cache"
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "agent-skills-updater"
+
+
+@functools.cache
+def _yaml_loader() -> type:
+    """Return the LibYAML-backed safe loader, or the pure-Python one without libyaml."""
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
+
+
+@functools.cache
+def _yaml_dumper() -> type:
+    """Return the LibYAML-backed safe dumper, or the pure-Python one without libyaml."""
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    return Dumper
+
+
+def _expand_path(raw: str, home: Path | None = None) -> Path:
+    """Expand ~ in a path string and resolve it.
 
+    Pass home to share a single Path.home() lookup across several paths.
+    """
+    if raw == "~" or raw.startswith(("~/", "~" + os.sep)):
+        path = (home if home is not None else Path.home()) / raw[2:]
+    else:
+        # Also covers ~user forms
+        path = Path(raw).expanduser()
+    return path.resolve()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RepoConfig:
     """Configuration for a single skill repository."""
 
@@ -41,16 +91,26 @@ class RepoConfig:
     branch: str | None = None
     structure: str = "standard"
 
+    # Derived once from name/url in __post_init__
+    safe_name: str = field(init=False, repr=False, compare=False)
+    archive_base_url: str = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        valid_structures = {"standard", "root", "template", "multi"}
-        if self.structure not in valid_structures:
+        if self.structure not in _VALID_STRUCTURES:
             raise ConfigError(
                 f"Repository '{self.name}': invalid structure '{self.structure}'. "
-                f"Must be one of: {', '.join(sorted(valid_structures))}"
+                f"Must be one of: {', '.join(sorted(_VALID_STRUCTURES))}"
             )
+        # Name as a single path component (org/repo -> org_repo)
+        object.__setattr__(self, "safe_name", self.name.replace("/", "_"))
+        object.__setattr__(self, "archive_base_url", self.url.removesuffix(".git"))
 
+    def archive_url(self, branch: str) -> str:
+        """Return the GitHub zip archive URL for a branch."""
+        return f"{self.archive_base_url}/archive/refs/heads/{branch}.zip"
 
-@dataclass
+
+@dataclass(frozen=True)
 class AppConfig:
     """Application configuration loaded from YAML."""
 
@@ -72,6 +132,13 @@ class AppConfig:
     )
     keep_backups: int = 5
 
+    # Number of repositories downloaded concurrently
+    parallel_downloads: int = 4
+
+    # Install skills as hardlinks to the downloaded files (same filesystem only);
+    # when off, files are reflinked or copied so each install has its own inodes
+    hardlink_skills: bool = True
+
     # Security
     allowed_hosts: list[str] = field(default_factory=list)
 
@@ -101,9 +168,9 @@ def _find_config_file(config_path: Path | None = None) -> Path | None:
     4. Home directory
     """
     if config_path is not None:
-        if config_path.is_file():
-            return config_path
-        raise ConfigError(f"Config file not found: {config_path}")
+        # Existence is checked by the stat in _load_config_cached (and by click
+        # before that on the CLI path), so don't stat the file twice here.
+        return config_path
 
     search_dirs = [
         Path.cwd(),
@@ -132,13 +199,20 @@ def _parse_settings(raw: dict[str, Any]) -> dict[str, Any]:
         "backupPath": "backup_path",
     }
 
+    home = Path.home()
     for yaml_key, attr_name in path_keys.items():
         if yaml_key in raw:
-            result[attr_name] = _expand_path(raw[yaml_key])
+            result[attr_name] = _expand_path(raw[yaml_key], home)
 
     if "keepBackups" in raw:
         result["keep_backups"] = int(raw["keepBackups"])
 
+    if "parallelDownloads" in raw:
+        result["parallel_downloads"] = max(1, int(raw["parallelDownloads"]))
+
+    if "hardlinkSkills" in raw:
+        result["hardlink_skills"] = bool(raw["hardlinkSkills"])
+
     if "allowedHosts" in raw:
         hosts = raw["allowedHosts"]
         if isinstance(hosts, list):
@@ -181,29 +255,29 @@ def _parse_repositories(raw: dict[str, Any]) -> list[RepoConfig]:
     return repos
 
 
-def load_config(config_path: Path | None = None) -> AppConfig:
-    """Load application config from YAML file.
-
-    Returns sensible defaults if no config file is found.
-    """
-    found_path = _find_config_file(config_path)
-
-    if found_path is None:
-        return AppConfig()
-
+def _read_config_data(path: Path) -> dict[str, Any]:
+    """Read a YAML config file and return its top-level mapping."""
+    # Hand libyaml the raw bytes: given a str, the C loader would re-encode it
+    # to UTF-8 before parsing, so decoding here only adds a round-trip
     try:
-        text = found_path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except OSError as exc:
         raise ConfigError(f"Cannot read config file: {exc}") from exc
 
+    import yaml
+
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(raw, Loader=_yaml_loader())
     except yaml.YAMLError as exc:
         raise ConfigError(f"Invalid YAML in config file: {exc}") from exc
 
     if not isinstance(data, dict):
         raise ConfigError("Config file must contain a YAML mapping at the top level")
+    return data
+
 
+def _build_config(data: dict[str, Any], path: Path) -> AppConfig:
+    """Validate a config mapping and build an AppConfig, expanding its paths."""
     # Parse settings
     settings_raw = data.get("settings", {})
     if not isinstance(settings_raw, dict):
@@ -217,10 +291,82 @@ def load_config(config_path: Path | None = None) -> AppConfig:
     return AppConfig(
         **settings,
         repositories=repositories,
-        config_file_path=found_path,
+        config_file_path=path,
     )
 
 
+def _load_config_cached(path: Path) -> AppConfig:
+    """Parse a config file, reusing earlier results while the file is unchanged.
+
+    Results are kept in memory for the life of the process, keyed on the file's
+    path, mtime and size plus the home and working directories that ~ and
+    relative paths are expanded against. Across runs only the parsed YAML is
+    pickled to disk, keyed on the file, the cache schema and the package
+    version. Paths are expanded and resolved after loading it, so a repointed
+    symlink is picked up by the next run.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError as exc:
+        raise ConfigError(f"Config file not found: {path}") from exc
+    except OSError as exc:
+        raise ConfigError(f"Cannot read config file: {exc}") from exc
+
+    return _load_config_memo(path, st.st_mtime_ns, st.st_size, str(Path.home()), os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_memo(
+    path: Path, mtime_ns: int, size: int, home: str, cwd: str
+) -> AppConfig:
+    """Return the config for one cache key, consulting the on-disk cache first."""
+    return _build_config(_load_config_data(path, mtime_ns, size), path)
+
+
+def _load_config_data(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Return the parsed YAML of a config file, from the on-disk cache if current."""
+    key = (_CACHE_SCHEMA, __version__, str(path), mtime_ns, size)
+    cache_file = _default_cache_dir() / _CONFIG_CACHE_NAME
+
+    try:
+        with cache_file.open("rb") as f:
+            cached_key, cached_data = pickle.load(f)
+        if cached_key == key and isinstance(cached_data, dict):
+            return cached_data
+    except Exception:
+        # Missing, stale-format or corrupt cache: fall through and reparse
+        pass
+
+    data = _read_config_data(path)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{_CONFIG_CACHE_NAME}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps((key, data), protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+
+    return data
+
+
+def load_config(config_path: Path | None = None) -> AppConfig:
+    """Load application config from YAML file.
+
+    Returns sensible defaults if no config file is found.
+    """
+    found_path = _find_config_file(config_path)
+
+    if found_path is None:
+        return AppConfig()
+
+    return _load_config_cached(found_path)
+
+
+# Parsed configs are shared between callers, hence the frozen dataclasses
+load_config.cache_clear = _load_config_memo.cache_clear  # type: ignore[attr-defined]
+
+
 def save_allowed_host(config: AppConfig, host: str) -> None:
     """Add a host to allowedHosts in the config file.
 
@@ -234,9 +380,10 @@ def save_allowed_host(config: AppConfig, host: str) -> None:
 
     config.allowed_hosts.append(host)
 
+    import yaml
+
     try:
-        text = config.config_file_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(text) or {}
+        data = yaml.load(config.config_file_path.read_bytes(), Loader=_yaml_loader()) or {}
     except (OSError, yaml.YAMLError):
         return
 
@@ -247,7 +394,9 @@ def save_allowed_host(config: AppConfig, host: str) -> None:
 
     try:
         config.config_file_path.write_text(
-            yaml.dump(data, default_flow_style=False, sort_keys=False),
+            yaml.dump(
+                data, Dumper=_yaml_dumper(), default_flow_style=False, sort_keys=False
+            ),
             encoding="utf-8",
         )
     except OSError:
@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
-import io
+import atexit
+import functools
 import os
+import re
 import shutil
 import stat
 import subprocess
+import tempfile
+import threading
 import zipfile
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-import requests
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
+# requests and rich.progress are imported where used: commands that never
+# download (list, restore, --help) should not pay for loading them
 if TYPE_CHECKING:
+    import requests
+
     from agent_skills_updater.cli import Context
     from agent_skills_updater.config import AppConfig, RepoConfig
 
+# Shared HTTP session so archive downloads reuse pooled TCP/TLS connections
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+_SESSION_POOL = 0
+_SESSION_POOL_SIZE = 8
+
+# "git sparse-checkout" (and partial clone, 2.19+) is needed for sparse clones
+_SPARSE_CHECKOUT_MIN_GIT = (2, 25)
+
+# Read size when streaming archive downloads to disk
+_ARCHIVE_CHUNK_SIZE = 64 * 1024
+
+# Hosts trusted without being listed in allowedHosts
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+
 
 def _rmtree(path: Path) -> None:
     """Remove a directory tree, handling read-only files on Windows."""
@@ -30,6 +52,47 @@ def _rmtree(path: Path) -> None:
     shutil.rmtree(path, onexc=_on_error)
 
 
+def _get_session(pool_size: int = _SESSION_POOL_SIZE) -> requests.Session:
+    """Return the shared requests session, creating it on first use.
+
+    pool_size is the number of connections kept per host. It should cover the
+    number of concurrent downloads, otherwise urllib3 discards the surplus
+    connections and later requests pay for a fresh TCP/TLS handshake.
+    """
+    global _SESSION, _SESSION_POOL
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+
+            _SESSION = requests.Session()
+            atexit.register(_SESSION.close)
+        if pool_size > _SESSION_POOL:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=("GET",),
+                ),
+            )
+            _SESSION.mount("https://", adapter)
+            _SESSION_POOL = pool_size
+        return _SESSION
+
+
+def _rmtree_if_exists(path: Path) -> None:
+    """Remove a directory tree, treating an already-missing path as success."""
+    try:
+        _rmtree(path)
+    except FileNotFoundError:
+        pass
+
+
 @dataclass
 class DownloadResult:
     """Result of downloading a single repository."""
@@ -44,8 +107,9 @@ class DownloadError(Exception):
     """Raised when a download fails."""
 
 
-def _is_git_available() -> bool:
-    """Check if git is installed and available on PATH."""
+@functools.cache
+def _git_version() -> tuple[int, ...] | None:
+    """Return the installed git version, or None if git is not on PATH."""
     try:
         result = subprocess.run(
             ["git", "--version"],
@@ -53,11 +117,25 @@ def _is_git_available() -> bool:
             text=True,
             timeout=10,
         )
-        return result.returncode == 0
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    # "git version 2.39.5" / "git version 2.45.1.windows.1"
+    match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", result.stdout)
+    if match is None:
+        return ()
+    return tuple(int(part) for part in match.groups(default="0"))
 
 
+def _is_git_available() -> bool:
+    """Check if git is installed and available on PATH."""
+    return _git_version() is not None
+
+
+@functools.lru_cache(maxsize=256)
 def _extract_host(url: str) -> str:
     """Extract hostname from a git URL."""
     if url.startswith("git@"):
@@ -67,20 +145,30 @@ def _extract_host(url: str) -> str:
     return parsed.hostname or ""
 
 
+def _is_github_host(host: str) -> bool:
+    """Check if a hostname is GitHub (trusted by default)."""
+    return host in _GITHUB_HOSTS
+
+
 def _is_github_url(url: str) -> bool:
     """Check if a URL points to GitHub (trusted by default)."""
-    host = _extract_host(url)
-    return host in ("github.com", "www.github.com")
+    return _is_github_host(_extract_host(url))
 
 
-def _check_host_allowed(url: str, config: AppConfig, ctx: Context) -> bool:
-    """Check if the repo host is allowed, prompting the user if needed."""
-    if _is_github_url(url):
-        return True
+def _check_host_allowed(
+    url: str, config: AppConfig, ctx: Context, allowed: set[str] | None = None
+) -> bool:
+    """Check if the repo host is allowed, prompting the user if needed.
 
+    allowed is a set view of config.allowed_hosts for callers checking many
+    repos; hosts the user chooses to always allow are added to it.
+    """
     host = _extract_host(url)
 
-    if host in config.allowed_hosts:
+    if _is_github_host(host):
+        return True
+
+    if host in (config.allowed_hosts if allowed is None else allowed):
         return True
 
     if ctx.trust_all:
@@ -107,33 +195,62 @@ def _check_host_allowed(url: str, config: AppConfig, ctx: Context) -> bool:
         from agent_skills_updater.config import save_allowed_host
 
         save_allowed_host(config, host)
+        if allowed is not None:
+            allowed.add(host)
         ctx.console.print(f"  [dim]Added {host} to allowedHosts in config.[/]")
 
     return True
 
 
-def _git_clone(repo: RepoConfig, dest: Path, ctx: Context) -> None:
-    """Clone a repository using git."""
-    cmd = ["git", "clone", "--depth", "1"]
-
-    if repo.branch:
-        cmd.extend(["--branch", repo.branch])
-
-    cmd.extend([repo.url, str(dest)])
-
+def _run_git(cmd: list[str], ctx: Context, what: str) -> None:
+    """Run a git command, raising DownloadError with its stderr on failure."""
     if ctx.verbose:
         ctx.console.print(f"  [dim]$ {' '.join(cmd)}[/]")
 
+    # stdout is never inspected, so send it straight to the null device
     result = subprocess.run(
         cmd,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         timeout=120,
     )
 
     if result.returncode != 0:
-        stderr = result.stderr.strip()
-        raise DownloadError(f"git clone failed: {stderr}")
+        stderr = result.stderr.decode("utf-8", "replace").strip()
+        raise DownloadError(f"{what} failed: {stderr}")
+
+
+def _git_clone(repo: RepoConfig, dest: Path, ctx: Context) -> None:
+    """Clone a repository using git.
+
+    For multi-structure repos, only the configured skill directories are
+    checked out: the clone skips blobs (partial clone) and a cone-mode sparse
+    checkout then fetches just the files under those directories.
+    """
+    version = _git_version() or ()
+    sparse = (
+        repo.structure == "multi"
+        and bool(repo.skills)
+        and version >= _SPARSE_CHECKOUT_MIN_GIT
+    )
+
+    cmd = ["git", "clone", "--depth", "1", "--single-branch"]
+
+    if sparse:
+        cmd.extend(["--filter=blob:none", "--no-checkout"])
+
+    if repo.branch:
+        cmd.extend(["--branch", repo.branch])
+
+    cmd.extend([repo.url, str(dest)])
+
+    _run_git(cmd, ctx, "git clone")
+
+    if sparse:
+        git_dir = ["git", "-C", str(dest)]
+        _run_git([*git_dir, "sparse-checkout", "init", "--cone"], ctx, "git sparse-checkout")
+        _run_git([*git_dir, "sparse-checkout", "set", *repo.skills], ctx, "git sparse-checkout")
+        _run_git([*git_dir, "checkout"], ctx, "git checkout")
 
 
 def _archive_download(repo: RepoConfig, dest: Path, ctx: Context) -> None:
@@ -145,33 +262,51 @@ def _archive_download(repo: RepoConfig, dest: Path, ctx: Context) -> None:
 
     # Convert git URL to GitHub archive URL
     # https://github.com/user/repo.git -> https://github.com/user/repo/archive/refs/heads/main.zip
-    base_url = repo.url.removesuffix(".git")
-    branch = repo.branch or "main"
-    archive_url = f"{base_url}/archive/refs/heads/{branch}.zip"
+    archive_url = repo.archive_url(repo.branch or "main")
 
     if ctx.verbose:
         ctx.console.print(f"  [dim]Downloading archive: {archive_url}[/]")
 
-    try:
-        response = requests.get(archive_url, timeout=60, stream=True)
-        response.raise_for_status()
-    except requests.RequestException as exc:
-        raise DownloadError(f"Archive download failed: {exc}") from exc
+    import requests
 
+    # Extract next to dest (same filesystem) so the result can be renamed into place
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(dir=dest.parent, prefix=f".{dest.name}-"))
     try:
-        zip_data = io.BytesIO(response.content)
-        with zipfile.ZipFile(zip_data) as zf:
-            zf.extractall(dest)
+        # Spool the archive to disk as it arrives instead of holding it in memory
+        with tempfile.TemporaryFile() as zip_data:
+            try:
+                with _get_session().get(archive_url, timeout=60, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=_ARCHIVE_CHUNK_SIZE):
+                        zip_data.write(chunk)
+            except requests.RequestException as exc:
+                raise DownloadError(f"Archive download failed: {exc}") from exc
 
-        # ZIP extracts into a subdirectory like repo-main/, move contents up
-        subdirs = [d for d in dest.iterdir() if d.is_dir()]
-        if len(subdirs) == 1:
-            extracted = subdirs[0]
-            for item in extracted.iterdir():
-                shutil.move(str(item), str(dest / item.name))
-            extracted.rmdir()
-    except (zipfile.BadZipFile, OSError) as exc:
-        raise DownloadError(f"Failed to extract archive: {exc}") from exc
+            try:
+                zip_data.seek(0)
+                with zipfile.ZipFile(zip_data) as zf:
+                    zf.extractall(staging)
+            except (zipfile.BadZipFile, OSError) as exc:
+                raise DownloadError(f"Failed to extract archive: {exc}") from exc
+
+        try:
+            # ZIP extracts into a subdirectory like repo-main/; that directory
+            # becomes dest with a single rename instead of moving its contents
+            with os.scandir(staging) as it:
+                subdirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+            extracted = Path(subdirs[0]) if len(subdirs) == 1 else staging
+            try:
+                # Replace an empty dest left by an earlier attempt
+                dest.rmdir()
+            except FileNotFoundError:
+                pass
+            extracted.rename(dest)
+        except OSError as exc:
+            raise DownloadError(f"Failed to extract archive: {exc}") from exc
+    finally:
+        if staging.exists():
+            _rmtree(staging)
 
 
 def _download_one(
@@ -182,11 +317,10 @@ def _download_one(
     git_available: bool,
 ) -> DownloadResult:
     """Download a single repository."""
-    dest = temp_dir / repo.name.replace("/", "_")
+    dest = temp_dir / repo.safe_name
 
     # Clean up any previous download
-    if dest.exists():
-        _rmtree(dest)
+    _rmtree_if_exists(dest)
 
     try:
         if git_available:
@@ -204,9 +338,7 @@ def _download_one(
                     "  [dim]Git failed, trying archive fallback...[/]"
                 )
             try:
-                if dest.exists():
-                    _rmtree(dest)
-                dest.mkdir(parents=True, exist_ok=True)
+                _rmtree_if_exists(dest)
                 _archive_download(repo, dest, ctx)
                 return DownloadResult(repo=repo, local_path=dest, success=True)
             except DownloadError as fallback_exc:
@@ -230,15 +362,28 @@ def _download_one(
         )
 
 
-def download_repos(config: AppConfig, ctx: Context) -> list[DownloadResult]:
+def download_repos(
+    config: AppConfig, ctx: Context, skill_filter: Collection[str] | None = None
+) -> list[DownloadResult]:
     """Download all configured repositories.
 
+    With skill_filter, repositories that provide none of the named skills are
+    not downloaded at all.
+
     Returns a list of DownloadResult for each repo (success or failure).
     """
     if not config.repositories:
         ctx.console.print("[dim]No repositories configured.[/]")
         return []
 
+    repositories = config.repositories
+    if skill_filter:
+        wanted = frozenset(skill_filter)
+        repositories = [r for r in repositories if not wanted.isdisjoint(r.skills)]
+        if not repositories:
+            ctx.console.print("[dim]No configured repository provides the requested skills.[/]")
+            return []
+
     git_available = _is_git_available()
     if not git_available:
         ctx.console.print(
@@ -248,41 +393,80 @@ def download_repos(config: AppConfig, ctx: Context) -> list[DownloadResult]:
     # Ensure temp directory exists
     config.temp_path.mkdir(parents=True, exist_ok=True)
 
-    results: list[DownloadResult] = []
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=ctx.console,
-        transient=True,
-    ) as progress:
-        for repo in config.repositories:
-            # Check host security
-            if not _check_host_allowed(repo.url, config, ctx):
-                ctx.console.print(
-                    f"  [red]Skipped[/] {repo.name} (host not allowed)"
-                )
-                results.append(
-                    DownloadResult(
-                        repo=repo,
-                        local_path=config.temp_path / repo.name.replace("/", "_"),
-                        success=False,
-                        error="Host not allowed",
-                    )
-                )
-                continue
-
-            task = progress.add_task(f"Downloading {repo.name}...", total=None)
-            result = _download_one(repo, config.temp_path, config, ctx, git_available)
-            progress.remove_task(task)
-
-            if result.success:
-                ctx.console.print(f"  [green]OK[/] {repo.name}")
-            else:
-                ctx.console.print(
-                    f"  [red]FAIL[/] {repo.name}: {result.error}"
-                )
-
-            results.append(result)
-
-    return results
+    jobs = ctx.jobs or config.parallel_downloads
+    if not git_available:
+        # Every repo goes through the archive fallback; keep one pooled
+        # connection per worker so concurrent downloads never evict each other
+        _get_session(pool_size=jobs)
+
+    # Host checks may prompt interactively, so they run serially before any
+    # download starts. Results keep the configured repository order.
+    results: list[DownloadResult | None] = [None] * len(repositories)
+    to_download: list[tuple[int, RepoConfig]] = []
+
+    allowed_hosts = set(config.allowed_hosts)
+    for index, repo in enumerate(repositories):
+        if not _check_host_allowed(repo.url, config, ctx, allowed_hosts):
+            ctx.console.print(
+                f"  [red]Skipped[/] {repo.name} (host not allowed)"
+            )
+            results[index] = DownloadResult(
+                repo=repo,
+                local_path=config.temp_path / repo.safe_name,
+                success=False,
+                error="Host not allowed",
+            )
+            continue
+        to_download.append((index, repo))
+
+    # Repos whose names map to the same directory (org/repo and org_repo) would
+    # race on it, so each such group downloads serially, in configured order,
+    # as one job; the last one wins, as it did when every download was serial
+    chains: dict[str, list[tuple[int, RepoConfig]]] = {}
+    for index, repo in to_download:
+        chains.setdefault(repo.safe_name, []).append((index, repo))
+
+    def download_chain(chain: list[tuple[int, RepoConfig]]) -> list[DownloadResult]:
+        return [
+            _download_one(repo, config.temp_path, config, ctx, git_available)
+            for _index, repo in chain
+        ]
+
+    if chains:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        with (
+            Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=ctx.console,
+                transient=True,
+            ) as progress,
+            ThreadPoolExecutor(max_workers=min(jobs, len(chains))) as pool,
+        ):
+            # git clone and requests release the GIL while waiting on the network
+            futures = {}
+            for chain in chains.values():
+                tasks = [
+                    progress.add_task(f"Downloading {repo.name}...", total=None)
+                    for _index, repo in chain
+                ]
+                futures[pool.submit(download_chain, chain)] = (chain, tasks)
+
+            for future in as_completed(futures):
+                chain, tasks = futures[future]
+                for (index, _repo), task, result in zip(
+                    chain, tasks, future.result(), strict=True
+                ):
+                    progress.remove_task(task)
+
+                    if result.success:
+                        ctx.console.print(f"  [green]OK[/] {result.repo.name}")
+                    else:
+                        ctx.console.print(
+                            f"  [red]FAIL[/] {result.repo.name}: {result.error}"
+                        )
+
+                    results[index] = result
+
+    return [r for r in results if r is not None]
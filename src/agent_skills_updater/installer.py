@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+
 if TYPE_CHECKING:
     from agent_skills_updater.cli import Context
     from agent_skills_updater.config import AppConfig
     from agent_skills_updater.downloader import DownloadResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstalledSkill:
     """Record of a single installed skill."""
 
@@ -26,11 +38,14 @@ class InstalledSkill:
     updated_at: str = field(default_factory=lambda: "")
 
     def __post_init__(self) -> None:
+        # Only read the clock when a timestamp was not supplied
+        if self.installed_at and self.updated_at:
+            return
         now = datetime.now(UTC).isoformat(timespec="seconds")
         if not self.installed_at:
-            self.installed_at = now
+            object.__setattr__(self, "installed_at", now)
         if not self.updated_at:
-            self.updated_at = now
+            object.__setattr__(self, "updated_at", now)
 
     def to_dict(self) -> dict[str, str]:
         return {
@@ -43,56 +58,218 @@ class InstalledSkill:
         }
 
 
-def _find_skill_dir_standard(repo_path: Path, skill_name: str) -> Path | None:
-    """Find a skill in standard structure: skills/<name>/ or src/skills/<name>/."""
-    candidates = [
-        repo_path / "skills" / skill_name,
-        repo_path / "src" / "skills" / skill_name,
+SkillFinder = Callable[[str], Path | None]
+
+# Repositories installed concurrently; the work is filesystem-bound
+_INSTALL_WORKERS = 8
+
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+# ioctl(FICLONE) shares extents copy-on-write on Btrfs, XFS and other
+# reflink-capable Linux filesystems; value is _IOW(0x94, 9, int)
+_HAS_FICLONE = fcntl is not None and sys.platform.startswith("linux")
+_FICLONE = 0x40049409
+_COPY_RANGE_MIN_CHUNK = 1024 * 1024
+
+
+def _subdir_names(path: Path) -> frozenset[str]:
+    """Return the names of the subdirectories of path, or nothing if it is not a directory."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+def _make_standard_finder(repo_path: Path) -> SkillFinder:
+    """Find skills in standard structure: skills/<name>/ or src/skills/<name>/."""
+    # Each skills root is listed once; lookups are then set membership tests
+    roots = [
+        (root, _subdir_names(root))
+        for root in (repo_path / "skills", repo_path / "src" / "skills")
     ]
-    for candidate in candidates:
-        if candidate.is_dir():
-            return candidate
-    return None
 
+    def find(skill_name: str) -> Path | None:
+        for root, names in roots:
+            if skill_name in names:
+                return root / skill_name
+        return None
+
+    return find
 
-def _find_skill_dir_root(repo_path: Path, skill_name: str) -> Path | None:
-    """Find a skill in root structure: SKILL.md in repo root."""
-    if (repo_path / "SKILL.md").is_file():
-        return repo_path
-    return None
 
+def _make_root_finder(repo_path: Path) -> SkillFinder:
+    """Find the skill in root structure: SKILL.md in repo root."""
+    found = repo_path if (repo_path / "SKILL.md").is_file() else None
+    return lambda skill_name: found
 
-def _find_skill_dir_template(repo_path: Path, skill_name: str) -> Path | None:
-    """Find a skill in template structure: template/ subdirectory."""
+
+def _make_template_finder(repo_path: Path) -> SkillFinder:
+    """Find the skill in template structure: template/ subdirectory."""
     template_dir = repo_path / "template"
-    if template_dir.is_dir():
-        return template_dir
-    return None
+    found = template_dir if template_dir.is_dir() else None
+    return lambda skill_name: found
 
 
-def _find_skill_dir_multi(repo_path: Path, skill_name: str) -> Path | None:
-    """Find a skill in multi structure: subdirectories with SKILL.md each."""
-    candidate = repo_path / skill_name
-    if candidate.is_dir() and (candidate / "SKILL.md").is_file():
-        return candidate
+def _make_multi_finder(repo_path: Path) -> SkillFinder:
+    """Find skills in multi structure: subdirectories with SKILL.md each."""
+    names = _subdir_names(repo_path)
 
-    # Also check direct subdirectories for SKILL.md
-    for subdir in repo_path.iterdir():
-        if subdir.is_dir() and subdir.name == skill_name:
-            if (subdir / "SKILL.md").is_file():
-                return subdir
+    def find(skill_name: str) -> Path | None:
+        if skill_name not in names:
+            return None
+        candidate = repo_path / skill_name
+        if (candidate / "SKILL.md").is_file():
+            return candidate
+        return None
 
-    return None
+    return find
 
 
-_STRUCTURE_FINDERS = {
-    "standard": _find_skill_dir_standard,
-    "root": _find_skill_dir_root,
-    "template": _find_skill_dir_template,
-    "multi": _find_skill_dir_multi,
+# Each factory inspects the repo layout once and returns a per-skill lookup
+_STRUCTURE_FINDERS: dict[str, Callable[[Path], SkillFinder]] = {
+    "standard": _make_standard_finder,
+    "root": _make_root_finder,
+    "template": _make_template_finder,
+    "multi": _make_multi_finder,
 }
 
 
+def _reflink(src: str, dst: str) -> bool:
+    """Clone src to dst with FICLONE; return False if the filesystem cannot reflink."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            return False
+    return True
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy src to dst in the kernel with copy_file_range.
+
+    Returns False, leaving dst to be overwritten, if the call is unsupported
+    for this pair of files (old kernel, cross-filesystem before Linux 5.3, ...)
+    or stops short of the source size, as some filesystems report 0 copied
+    bytes (EOF) on the first call instead of failing.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(in_fd).st_size
+        chunk = max(size, _COPY_RANGE_MIN_CHUNK)
+        copied = 0
+        while True:
+            try:
+                n = os.copy_file_range(in_fd, out_fd, chunk)
+            except OSError:
+                if copied:
+                    raise
+                return False
+            if n == 0:
+                return copied >= size
+            copied += n
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """Copy a file with its metadata, preferring a reflink, then an in-kernel copy."""
+    if (_HAS_FICLONE and _reflink(src, dst)) or (
+        _HAS_COPY_FILE_RANGE and _copy_file_range(src, dst)
+    ):
+        shutil.copystat(src, dst)
+        return dst
+    return shutil.copy2(src, dst)
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """copytree copy_function: hardlink the file, or copy it if linking fails.
+
+    A hardlink costs one metadata operation and no data I/O. It only works
+    within a filesystem, so cross-device targets (EXDEV), or filesystems without
+    hardlink support, fall back to a regular copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        return _copy_file(src, dst)
+    return dst
+
+
+# Relative directory paths (parents first, "" for the root), regular file
+# paths, and paths of symlinks to files
+TreePlan = tuple[list[str], list[str], list[str]]
+
+
+def _plan_tree(source_dir: Path) -> TreePlan:
+    """Walk a skill tree once with os.scandir and return its layout.
+
+    The plan is reused for every target the skill is installed into, so the
+    source is listed once rather than once per target. Like copytree, linked
+    directories are walked into; file symlinks are listed separately because
+    link(2) would hardlink the symlink itself rather than its target.
+    """
+    root = os.fspath(source_dir)
+    dirs: list[str] = [""]
+    files: list[str] = []
+    symlinks: list[str] = []
+    pending = [""]
+    while pending:
+        rel = pending.pop()
+        with os.scandir(os.path.join(root, rel)) as it:
+            for entry in it:
+                child = os.path.join(rel, entry.name) if rel else entry.name
+                if entry.is_dir():
+                    dirs.append(child)
+                    pending.append(child)
+                elif entry.is_symlink():
+                    symlinks.append(child)
+                else:
+                    files.append(child)
+    return dirs, files, symlinks
+
+
+def _lazy_plan(source_dir: Path) -> Callable[[], TreePlan]:
+    """Return a thread-safe getter that plans source_dir on its first call only.
+
+    Targets that are skipped never call it, so a skill already installed
+    everywhere is not walked at all.
+    """
+    lock = threading.Lock()
+    planned: list[TreePlan] = []
+
+    def get_plan() -> TreePlan:
+        with lock:
+            if not planned:
+                planned.append(_plan_tree(source_dir))
+            return planned[0]
+
+    return get_plan
+
+
+def _clone_tree(
+    source_dir: Path, dest: Path, hardlink: bool = True, plan: TreePlan | None = None
+) -> None:
+    """Replicate a skill tree at dest, sharing file data with the source where possible.
+
+    With hardlink=False every installed file gets its own inode, so editing an
+    installed skill can never write through to the download it came from.
+    Like copytree, dest must not exist yet and directory metadata is copied last.
+    Symlinks are replaced by copies of their targets; a dangling one raises.
+    """
+    dirs, files, symlinks = plan if plan is not None else _plan_tree(source_dir)
+    copy_function = _link_or_copy if hardlink else _copy_file
+    src_root, dst_root = os.fspath(source_dir), os.fspath(dest)
+
+    # Every directory is created exactly once, parents before children
+    os.makedirs(dst_root)
+    for rel in dirs[1:]:
+        os.mkdir(os.path.join(dst_root, rel))
+    for rel in files:
+        copy_function(os.path.join(src_root, rel), os.path.join(dst_root, rel))
+    for rel in symlinks:
+        _copy_file(os.path.join(src_root, rel), os.path.join(dst_root, rel))
+    for rel in reversed(dirs):
+        shutil.copystat(os.path.join(src_root, rel), os.path.join(dst_root, rel))
+
+
 def _copy_skill(
     source_dir: Path,
     target_dir: Path,
@@ -100,34 +277,153 @@ def _copy_skill(
     force: bool,
     dry_run: bool,
     ctx: Context,
+    hardlink: bool = True,
+    get_plan: Callable[[], TreePlan] | None = None,
 ) -> bool:
     """Copy a skill directory to the target location.
 
     Returns True if the skill was copied (or would be in dry-run).
     """
     dest = target_dir / skill_name
+    exists = dest.exists()
 
-    if dest.exists() and not force:
+    if exists and not force:
         if ctx.verbose:
             ctx.console.print(f"    [dim]Skipped {dest} (exists, use --force)[/]")
         return False
 
     if dry_run:
-        action = "overwrite" if dest.exists() else "install"
+        action = "overwrite" if exists else "install"
         ctx.console.print(f"    [dim]Would {action}: {dest}[/]")
         return True
 
-    # Ensure parent directory exists
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    # Read the source before touching dest, so a failed walk leaves it intact
+    plan = get_plan() if get_plan is not None else None
 
-    # Remove existing if force
-    if dest.exists():
-        shutil.rmtree(dest)
+    # Remove existing if force (rmtree itself reports a vanished dest)
+    if exists:
+        try:
+            shutil.rmtree(dest)
+        except FileNotFoundError:
+            pass
 
-    shutil.copytree(source_dir, dest)
+    _clone_tree(source_dir, dest, hardlink=hardlink, plan=plan)
     return True
 
 
+def _copy_to_target(
+    skill_dir: Path,
+    target_path: Path,
+    skill_name: str,
+    ctx: Context,
+    hardlink: bool,
+    get_plan: Callable[[], TreePlan],
+) -> bool:
+    """Copy one skill into one target, reporting (not raising) filesystem errors."""
+    try:
+        return _copy_skill(
+            skill_dir,
+            target_path,
+            skill_name,
+            force=ctx.force,
+            dry_run=ctx.dry_run,
+            ctx=ctx,
+            hardlink=hardlink,
+            get_plan=get_plan,
+        )
+    except PermissionError as exc:
+        ctx.console.print(
+            f"    [red]Permission denied:[/] {exc}"
+        )
+    except OSError as exc:
+        ctx.console.print(
+            f"    [red]Error copying {skill_name}:[/] {exc}"
+        )
+    return False
+
+
+def _install_targets(config: AppConfig, dry_run: bool) -> list[Path]:
+    """Return the directories to install into, checked once per install run.
+
+    The global skills path is always a target and is created if missing (except
+    in a dry run); other agent directories are used only if they already exist.
+    """
+    global_path = config.global_skills_path
+    if not dry_run:
+        global_path.mkdir(parents=True, exist_ok=True)
+    return [global_path] + [
+        target for target in config.skill_target_paths
+        if target != global_path and target.is_dir()
+    ]
+
+
+def _copy_to_targets(
+    skill_dir: Path, targets: list[Path], skill_name: str, ctx: Context, hardlink: bool
+) -> bool:
+    """Copy a skill into every target directory.
+
+    Returns True if at least one target received the skill. Targets usually
+    live on different filesystems, so with two or more the copies run in parallel.
+    """
+    if not targets:
+        return False
+
+    # Walk the source at most once for all targets, and only when one copies
+    get_plan = _lazy_plan(skill_dir)
+
+    def copy_to(target: Path) -> bool:
+        return _copy_to_target(skill_dir, target, skill_name, ctx, hardlink, get_plan)
+
+    if len(targets) < 2:
+        return copy_to(targets[0])
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        copied = list(pool.map(copy_to, targets))
+    return any(copied)
+
+
+def _install_repo_skills(
+    result: DownloadResult,
+    finder: SkillFinder,
+    skill_names: list[str],
+    targets: list[Path],
+    config: AppConfig,
+    ctx: Context,
+    now: str,
+) -> list[InstalledSkill]:
+    """Install the named skills of one downloaded repository into every target."""
+    repo = result.repo
+    installed: list[InstalledSkill] = []
+
+    for skill_name in skill_names:
+        skill_dir = finder(skill_name)
+
+        if skill_dir is None:
+            if ctx.verbose:
+                ctx.console.print(
+                    f"    [yellow]Skill '{skill_name}' not found in {repo.name}[/]"
+                )
+            continue
+
+        any_copied = _copy_to_targets(
+            skill_dir, targets, skill_name, ctx, config.hardlink_skills
+        )
+
+        if any_copied:
+            installed.append(
+                InstalledSkill(
+                    name=skill_name,
+                    source=repo.name,
+                    source_url=repo.url,
+                    skill_path=str(skill_dir.relative_to(result.local_path)),
+                    installed_at=now,
+                    updated_at=now,
+                )
+            )
+
+    return installed
+
+
 def install_skills(
     config: AppConfig,
     results: list[DownloadResult],
@@ -138,69 +434,49 @@ def install_skills(
 
     Returns list of InstalledSkill records for lockfile tracking.
     """
-    installed: list[InstalledSkill] = []
+    filter_set = frozenset(skill_filter) if skill_filter else None
 
+    # Pick each repo's finder from the structure dispatch table and the skills
+    # it should provide, before touching any target directory
+    work: list[tuple[DownloadResult, SkillFinder, list[str]]] = []
     for result in results:
         if not result.success:
             continue
 
         repo = result.repo
-        finder = _STRUCTURE_FINDERS.get(repo.structure)
-        if finder is None:
+        make_finder = _STRUCTURE_FINDERS.get(repo.structure)
+        if make_finder is None:
             ctx.console.print(
                 f"  [red]Unknown structure '{repo.structure}' for {repo.name}[/]"
             )
             continue
 
-        skills_to_install = repo.skills
-        if skill_filter:
-            skills_to_install = [s for s in repo.skills if s in skill_filter]
+        if filter_set is None:
+            skills_to_install = repo.skills
+        else:
+            skills_to_install = [s for s in repo.skills if s in filter_set]
 
-        if not skills_to_install:
-            continue
+        if skills_to_install:
+            work.append((result, make_finder(result.local_path), skills_to_install))
 
-        for skill_name in skills_to_install:
-            skill_dir = finder(result.local_path, skill_name)
-
-            if skill_dir is None:
-                if ctx.verbose:
-                    ctx.console.print(
-                        f"    [yellow]Skill '{skill_name}' not found in {repo.name}[/]"
-                    )
-                continue
-
-            any_copied = False
-            for target_path in config.skill_target_paths:
-                if not target_path.is_dir():
-                    continue
-                try:
-                    copied = _copy_skill(
-                        skill_dir,
-                        target_path,
-                        skill_name,
-                        force=ctx.force,
-                        dry_run=ctx.dry_run,
-                        ctx=ctx,
-                    )
-                    if copied:
-                        any_copied = True
-                except PermissionError as exc:
-                    ctx.console.print(
-                        f"    [red]Permission denied:[/] {exc}"
-                    )
-                except OSError as exc:
-                    ctx.console.print(
-                        f"    [red]Error copying {skill_name}:[/] {exc}"
-                    )
-
-            if any_copied:
-                installed.append(
-                    InstalledSkill(
-                        name=skill_name,
-                        source=repo.name,
-                        source_url=repo.url,
-                        skill_path=str(skill_dir.relative_to(result.local_path)),
-                    )
-                )
+    if not work:
+        return []
 
-    return installed
+    targets = _install_targets(config, ctx.dry_run)
+    # One timestamp for the whole run instead of a clock read per skill
+    now = datetime.now(UTC).isoformat(timespec="seconds")
+
+    def install_repo(item: tuple[DownloadResult, SkillFinder, list[str]]) -> list[InstalledSkill]:
+        result, finder, skill_names = item
+        return _install_repo_skills(result, finder, skill_names, targets, config, ctx, now)
+
+    # Repositories install concurrently, unless two of them provide a skill of
+    # the same name: those must overwrite each other in config order
+    names = [name for _, _, skill_names in work for name in skill_names]
+    if len(work) < 2 or len(names) != len(set(names)):
+        batches = [install_repo(item) for item in work]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_INSTALL_WORKERS, len(work))) as pool:
+            batches = list(pool.map(install_repo, work))
+
+    return list(chain.from_iterable(batches))
@@ -0,0 +1,43 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch this
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(
+    obj: Any, *, indent: bool = False, sort_keys: bool = False, ensure_ascii: bool = False
+) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes with a trailing newline.
+
+    With ensure_ascii, non-ASCII characters are written as \\uXXXX escapes. orjson
+    has no such option, so those calls always go through the stdlib encoder.
+    """
+    if orjson is not None and not ensure_ascii:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+    text = json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=ensure_ascii, sort_keys=sort_keys
+    )
+    return (text + "\n").encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import os
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from agent_skills_updater import jsonio
+
 if TYPE_CHECKING:
     from agent_skills_updater.config import AppConfig
     from agent_skills_updater.installer import InstalledSkill
@@ -21,10 +23,15 @@ class Lockfile:
     def __init__(self, entries: dict[str, dict[str, str]] | None = None) -> None:
         self.entries: dict[str, dict[str, str]] = entries or {}
 
-    def update_entry(self, skill: InstalledSkill) -> None:
-        """Add or update a skill entry in the lockfile."""
+    def update_entry(self, skill: InstalledSkill, now: str | None = None) -> None:
+        """Add or update a skill entry in the lockfile.
+
+        Pass now (an ISO-8601 timestamp) to stamp a batch of updates with a
+        single time; otherwise the current time is used.
+        """
         existing = self.entries.get(skill.name)
-        now = datetime.now(UTC).isoformat(timespec="seconds")
+        if now is None:
+            now = _now_iso()
 
         if existing:
             self.entries[skill.name] = {
@@ -51,6 +58,11 @@ class Lockfile:
         }
 
 
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string with second precision."""
+    return datetime.now(UTC).isoformat(timespec="seconds")
+
+
 def _lockfile_path(config: AppConfig) -> Path:
     """Determine the lockfile location (next to global skills path)."""
     return config.global_skills_path.parent / _LOCKFILE_NAME
@@ -60,13 +72,11 @@ def load_lockfile(config: AppConfig) -> Lockfile:
     """Load the lockfile from disk. Returns empty Lockfile if not found."""
     path = _lockfile_path(config)
 
-    if not path.is_file():
-        return Lockfile()
-
+    # Parse straight from bytes; a missing or unreadable file counts as empty.
+    # ValueError covers both malformed JSON and invalid UTF-8.
     try:
-        text = path.read_text(encoding="utf-8")
-        data = json.loads(text)
-    except (OSError, json.JSONDecodeError):
+        data = jsonio.loads(path.read_bytes())
+    except (OSError, ValueError):
         return Lockfile()
 
     if not isinstance(data, dict):
@@ -76,33 +86,129 @@ def load_lockfile(config: AppConfig) -> Lockfile:
     if not isinstance(entries, dict):
         return Lockfile()
 
-    # Normalize: ensure all values are dicts with string values
+    # Normalize: ensure all values are dicts with string values. Entries
+    # written by save_lockfile are already all-string and are kept as parsed.
     clean: dict[str, dict[str, str]] = {}
     for name, entry in entries.items():
         if isinstance(entry, dict):
-            clean[name] = {k: str(v) for k, v in entry.items()}
+            if all(isinstance(v, str) for v in entry.values()):
+                clean[name] = entry
+            else:
+                clean[name] = {k: str(v) for k, v in entry.items()}
 
     return Lockfile(entries=clean)
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_anonymous_temp(directory: Path, content: bytes) -> Path | None:
+    """Write content to an unnamed O_TMPFILE file, then link it under a temp name.
+
+    The file only gets a directory entry once it is complete, so a crash while
+    writing leaves nothing behind. Returns None where O_TMPFILE is unavailable
+    (non-Linux, old kernels, unsupported filesystems, no /proc).
+    """
+    o_tmpfile = getattr(os, "O_TMPFILE", None)
+    if o_tmpfile is None:
+        return None
+
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        try:
+            fd = os.open(".", o_tmpfile | os.O_WRONLY, 0o600, dir_fd=dir_fd)
+        except OSError:
+            return None
+        try:
+            _write_all(fd, content)
+            os.fsync(fd)
+            # linkat() cannot replace an existing file, so materialize under a
+            # temp name; the caller's rename then swaps it in atomically.
+            # Passing the dir fds makes os.link use linkat(AT_SYMLINK_FOLLOW).
+            tmp_name = f".skill-lock-{os.getpid()}-{os.urandom(4).hex()}.tmp"
+            try:
+                os.link(
+                    f"/proc/self/fd/{fd}", tmp_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd
+                )
+            except OSError:
+                # No /proc, or linking is refused here: use a named temp file
+                return None
+        finally:
+            os.close(fd)
+    finally:
+        os.close(dir_fd)
+    return directory / tmp_name
+
+
+def _write_named_temp(directory: Path, content: bytes) -> Path:
+    """Write content to a new mkstemp file in directory and return its path."""
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix=".tmp", prefix=".skill-lock-")
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            _write_all(fd, content)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry change (the rename) to disk where the OS allows it."""
+    if os.name == "nt":
+        # Directories cannot be opened for fsync on Windows
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Some filesystems reject fsync on directories; the data itself is synced
+        pass
+    finally:
+        os.close(fd)
+
+
 def save_lockfile(config: AppConfig, lockfile: Lockfile) -> None:
-    """Save the lockfile to disk using atomic write (temp file + rename)."""
+    """Save the lockfile to disk using atomic write (temp file + rename).
+
+    The write is skipped when the file on disk already has identical content.
+    """
     path = _lockfile_path(config)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    content = json.dumps(lockfile.to_dict(), indent=2, ensure_ascii=False) + "\n"
+    # Sorted keys keep the file stable across runs and diff-friendly
+    content = jsonio.dumps(lockfile.to_dict(), indent=True, sort_keys=True)
 
-    # Atomic write: write to temp file in same directory, then rename
+    # Nothing changed (e.g. no skills were updated): skip the write entirely
     try:
-        fd, tmp_path = tempfile.mkstemp(
-            dir=path.parent, suffix=".tmp", prefix=".skill-lock-"
-        )
+        if path.read_bytes() == content:
+            return
+    except OSError:
+        pass
+
+    # Atomic write: write to temp file in same directory, then rename. The data
+    # is fsynced first so a crash after the rename cannot leave an empty file.
+    try:
+        tmp_path = _write_anonymous_temp(path.parent, content)
+        if tmp_path is None:
+            tmp_path = _write_named_temp(path.parent, content)
         try:
-            with open(fd, "w", encoding="utf-8") as f:
-                f.write(content)
-            Path(tmp_path).replace(path)
+            tmp_path.replace(path)
         except BaseException:
-            Path(tmp_path).unlink(missing_ok=True)
+            tmp_path.unlink(missing_ok=True)
             raise
     except OSError as exc:
         raise OSError(f"Failed to write lockfile: {exc}") from exc
+
+    _fsync_dir(path.parent)
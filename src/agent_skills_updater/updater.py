@@ -2,34 +2,88 @@
 
 from __future__ import annotations
 
+import functools
 import subprocess
 import sys
+import time
+from pathlib import Path
+from typing import Any
 
-import requests
-
-from agent_skills_updater import __version__
+from agent_skills_updater import __version__, jsonio
 
 _PYPI_URL = "https://pypi.org/pypi/agent-skills-updater/json"
 _PACKAGE_NAME = "agent-skills-updater"
 _CHECK_TIMEOUT = 2  # seconds
+_CHECK_CACHE_NAME = "pypi-latest"
+_CHECK_CACHE_TTL = 86400  # seconds
+
+
+def _get(url: str, timeout: float) -> Any:
+    """GET a JSON document with the standard library.
+
+    One small request does not justify importing requests (and urllib3) on
+    every CLI start. Raises on network errors and non-2xx responses.
+    """
+    from urllib.request import Request, urlopen
+
+    request = Request(url, headers={"Accept": "application/json"})
+    with urlopen(request, timeout=timeout) as response:
+        return jsonio.loads(response.read())
 
 
-def check_for_update() -> tuple[str, str | None, bool]:
+def _check_cache_file() -> Path:
+    """Return the file holding the last PyPI version seen."""
+    from agent_skills_updater.config import _default_cache_dir
+
+    return _default_cache_dir() / _CHECK_CACHE_NAME
+
+
+def _read_cached_latest(cache_file: Path) -> str | None:
+    """Return the cached latest version if it was fetched within the TTL."""
+    try:
+        if time.time() - cache_file.stat().st_mtime >= _CHECK_CACHE_TTL:
+            return None
+        return cache_file.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _write_cached_latest(cache_file: Path, latest: str) -> None:
+    """Record the latest version; the file's mtime marks when it was fetched."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(latest, encoding="utf-8")
+    except OSError:
+        # The cache is an optimization; a read-only home just means re-checking
+        pass
+
+
+def check_for_update(use_cache: bool = True) -> tuple[str, str | None, bool]:
     """Check PyPI for a newer version.
 
+    The answer is cached for a day so frequent invocations skip the network
+    round-trip; pass use_cache=False to always ask PyPI.
+
     Returns:
         (current_version, latest_version_or_None, needs_update)
         If the check fails (timeout, offline, etc.), returns (current, None, False).
     """
     current = __version__
-    try:
-        resp = requests.get(_PYPI_URL, timeout=_CHECK_TIMEOUT)
-        resp.raise_for_status()
-        latest = resp.json()["info"]["version"]
-        needs_update = _version_tuple(latest) > _version_tuple(current)
-        return current, latest, needs_update
-    except Exception:
-        return current, None, False
+    cache_file = _check_cache_file()
+    latest = _read_cached_latest(cache_file) if use_cache else None
+
+    if latest is None:
+        try:
+            latest = _get(_PYPI_URL, timeout=_CHECK_TIMEOUT)["info"]["version"]
+            # A malformed payload (null or numeric version) is a failed check
+            if not isinstance(latest, str) or not latest:
+                raise ValueError(f"Unexpected PyPI version: {latest!r}")
+        except Exception:
+            return current, None, False
+        _write_cached_latest(cache_file, latest)
+
+    needs_update = _version_tuple(latest) > _version_tuple(current)
+    return current, latest, needs_update
 
 
 def run_self_update() -> tuple[bool, str]:
@@ -38,7 +92,7 @@ def run_self_update() -> tuple[bool, str]:
     Returns:
         (success, output_message)
     """
-    current, latest, needs_update = check_for_update()
+    current, latest, needs_update = check_for_update(use_cache=False)
 
     if latest is None:
         return False, "Could not reach PyPI to check for updates."
@@ -47,8 +101,20 @@ def run_self_update() -> tuple[bool, str]:
         return True, f"Already up to date (v{current})."
 
     try:
+        # pip runs out of process: its in-process API is private and would be
+        # replacing this package's files while they are imported. Skipping pip's
+        # own PyPI self-check saves a network round-trip.
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "--upgrade", _PACKAGE_NAME],
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--upgrade",
+                "--disable-pip-version-check",
+                "--no-input",
+                _PACKAGE_NAME,
+            ],
             capture_output=True,
             text=True,
             timeout=60,
@@ -62,6 +128,7 @@ def run_self_update() -> tuple[bool, str]:
         return False, f"Update failed: {exc}"
 
 
+@functools.lru_cache(maxsize=256)
 def _version_tuple(version: str) -> tuple[int, ...]:
     """Parse a version string into a comparable tuple."""
     parts: list[int] = []
@@ -1 +1,23 @@
 """Shared pytest fixtures for agent-skills-updater tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk caches out of the real user cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(
+        "agent_skills_updater.config._default_cache_dir", lambda: cache_dir
+    )
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Start every test without configs memoized by earlier tests."""
+    from agent_skills_updater.config import load_config
+
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
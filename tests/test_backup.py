@@ -1,9 +1,21 @@
 """Tests for backup creation and rollback."""
 
+import io
+import shutil
+from dataclasses import replace
+from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+from rich.console import Console
+
 from agent_skills_updater.backup import (
     BackupInfo,
+    _enforce_retention,
+    _latest_backup,
+    _parallel_copytree,
+    _target_label,
+    _timestamp_label,
     create_backup,
     list_backups,
     restore_backup,
@@ -44,6 +56,52 @@ def _create_skill(skills_path: Path, name: str, content: str = "# Skill") -> Non
     (d / "SKILL.md").write_text(content, encoding="utf-8")
 
 
+class TestParallelCopytree:
+    def test_copies_nested_tree(self, tmp_path):
+        src = tmp_path / "src"
+        _create_skill(src, "a", "# A")
+        _create_skill(src / "a", "nested", "# Nested")
+        (src / "top.txt").write_text("top", encoding="utf-8")
+
+        dst = tmp_path / "dst"
+        _parallel_copytree(src, dst)
+
+        assert (dst / "top.txt").read_text() == "top"
+        assert (dst / "a" / "SKILL.md").read_text() == "# A"
+        assert (dst / "a" / "nested" / "SKILL.md").read_text() == "# Nested"
+
+    def test_merges_into_existing_destination(self, tmp_path):
+        src = tmp_path / "src"
+        _create_skill(src, "a", "# New")
+        dst = tmp_path / "dst"
+        _create_skill(dst, "a", "# Old")
+        _create_skill(dst, "b", "# Keep")
+
+        _parallel_copytree(src, dst, workers=1)
+
+        assert (dst / "a" / "SKILL.md").read_text() == "# New"
+        assert (dst / "b" / "SKILL.md").read_text() == "# Keep"
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _parallel_copytree(tmp_path / "missing", tmp_path / "dst")
+
+
+class TestTimestampLabel:
+    def test_matches_strftime(self):
+        dt = datetime(2025, 6, 1, 9, 5, 3, 42, tzinfo=UTC)
+        assert _timestamp_label(dt) == dt.strftime("%Y%m%dT%H%M%S_%fZ")
+        assert _timestamp_label(dt) == "20250601T090503_000042Z"
+
+
+class TestTargetLabel:
+    def test_posix_path(self):
+        assert _target_label("/home/user/.agents/skills") == "_home_user_.agents_skills"
+
+    def test_windows_path(self):
+        assert _target_label("C:\\Users\\me\\skills") == "C_Users_me_skills"
+
+
 class TestCreateBackup:
     def test_empty_lockfile_returns_none(self, tmp_path):
         config = _make_config(tmp_path)
@@ -63,6 +121,18 @@ class TestCreateBackup:
         assert (result.path / "backup-meta.json").is_file()
         assert (result.path / "lockfile.json").is_file()
 
+    def test_skills_deduplicated_across_targets(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.windsurf_skills_path.mkdir()
+        for target in config.skill_target_paths:
+            _create_skill(target, "skill-b")
+            _create_skill(target, "skill-a")
+        lf = Lockfile(entries={"skill-b": {"source": "test"}, "skill-a": {"source": "test"}})
+
+        result = create_backup(config, lf)
+        assert result.skills == ["skill-a", "skill-b"]
+        assert result.skill_count == 2
+
     def test_retention_limit(self, tmp_path):
         config = _make_config(tmp_path)
         _create_skill(config.global_skills_path, "skill-a")
@@ -75,6 +145,27 @@ class TestCreateBackup:
         backups = list_backups(config)
         assert len(backups) <= config.keep_backups
 
+    def test_retention_keeps_newest(self, tmp_path):
+        config = _make_config(tmp_path)
+        _create_skill(config.global_skills_path, "skill-a")
+        lf = Lockfile(entries={"skill-a": {"source": "test"}})
+
+        created = [create_backup(config, lf).timestamp for _ in range(5)]
+
+        remaining = [b.timestamp for b in list_backups(config)]
+        assert remaining == sorted(created, reverse=True)[: config.keep_backups]
+
+    def test_retention_prunes_several_at_once(self, tmp_path):
+        config = replace(_make_config(tmp_path), keep_backups=10)
+        _create_skill(config.global_skills_path, "skill-a")
+        lf = Lockfile(entries={"skill-a": {"source": "test"}})
+        created = [create_backup(config, lf).timestamp for _ in range(5)]
+
+        _enforce_retention(replace(config, keep_backups=2))
+
+        remaining = [b.timestamp for b in list_backups(config)]
+        assert remaining == sorted(created, reverse=True)[:2]
+
 
 class TestListBackups:
     def test_no_backups(self, tmp_path):
@@ -95,6 +186,24 @@ class TestListBackups:
         assert backups[0].timestamp >= backups[1].timestamp
 
 
+class TestLatestBackup:
+    def test_no_backups(self, tmp_path):
+        config = _make_config(tmp_path)
+        assert _latest_backup(config) is None
+
+    def test_matches_first_listed_backup(self, tmp_path):
+        config = _make_config(tmp_path)
+        _create_skill(config.global_skills_path, "skill-a")
+        lf = Lockfile(entries={"skill-a": {"source": "test"}})
+
+        create_backup(config, lf)
+        create_backup(config, lf)
+
+        latest = _latest_backup(config)
+        assert latest == list_backups(config)[0]
+        assert latest.skills == ["skill-a"]
+
+
 class TestRestoreBackup:
     def test_restore_all(self, tmp_path):
         config = _make_config(tmp_path)
@@ -110,6 +219,45 @@ class TestRestoreBackup:
         assert success
         assert (config.global_skills_path / "skill-a" / "SKILL.md").read_text() == "# Original"
 
+    def test_restore_removes_stale_files_and_old_tree(self, tmp_path):
+        config = _make_config(tmp_path)
+        _create_skill(config.global_skills_path, "skill-a", "# Original")
+        create_backup(config, Lockfile(entries={"skill-a": {"source": "test"}}))
+
+        (config.global_skills_path / "skill-a" / "extra.md").write_text("added later")
+        assert restore_backup(config, FakeContext())
+
+        assert sorted(p.name for p in config.global_skills_path.iterdir()) == ["skill-a"]
+        assert sorted(p.name for p in (config.global_skills_path / "skill-a").iterdir()) == [
+            "SKILL.md"
+        ]
+
+    def test_restore_sweeps_leftover_old_trees(self, tmp_path):
+        config = _make_config(tmp_path)
+        _create_skill(config.global_skills_path, "skill-a", "# Original")
+        create_backup(config, Lockfile(entries={"skill-a": {"source": "test"}}))
+        _create_skill(config.global_skills_path, ".skill-b.old-0123abcd")
+
+        assert restore_backup(config, FakeContext())
+
+        assert sorted(p.name for p in config.global_skills_path.iterdir()) == ["skill-a"]
+
+    def test_restore_reports_undeletable_old_tree(self, tmp_path, monkeypatch):
+        config = _make_config(tmp_path)
+        _create_skill(config.global_skills_path, "skill-a", "# Original")
+        create_backup(config, Lockfile(entries={"skill-a": {"source": "test"}}))
+
+        def rmtree(path):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(shutil, "rmtree", rmtree)
+        ctx = FakeContext()
+        ctx.console = Console(file=io.StringIO(), width=200)
+
+        assert restore_backup(config, ctx)
+        assert "Could not remove" in ctx.console.file.getvalue()
+        assert (config.global_skills_path / "skill-a" / "SKILL.md").read_text() == "# Original"
+
     def test_restore_single_skill(self, tmp_path):
         config = _make_config(tmp_path)
         _create_skill(config.global_skills_path, "skill-a", "# A")
@@ -1,15 +1,20 @@
 """Tests for config loading and validation."""
 
+import dataclasses
+import os
 from pathlib import Path
 
 import pytest
 
+from agent_skills_updater import config as config_module
 from agent_skills_updater.config import (
     AppConfig,
     ConfigError,
     RepoConfig,
     _expand_path,
+    _load_config_cached,
     load_config,
+    save_allowed_host,
 )
 
 
@@ -22,6 +27,10 @@ class TestExpandPath:
         result = _expand_path(str(tmp_path / "foo"))
         assert result == tmp_path / "foo"
 
+    def test_explicit_home(self, tmp_path):
+        assert _expand_path("~/skills", tmp_path) == tmp_path.resolve() / "skills"
+        assert _expand_path("~", tmp_path) == tmp_path.resolve()
+
 
 class TestRepoConfig:
     def test_valid_structures(self):
@@ -37,6 +46,14 @@ class TestRepoConfig:
         repo = RepoConfig(name="test", url="https://example.com")
         assert repo.structure == "standard"
 
+    def test_derived_names_and_urls(self):
+        repo = RepoConfig(name="org/repo", url="https://github.com/org/repo.git")
+        assert repo.safe_name == "org_repo"
+        assert repo.archive_base_url == "https://github.com/org/repo"
+        assert repo.archive_url("dev") == (
+            "https://github.com/org/repo/archive/refs/heads/dev.zip"
+        )
+
 
 class TestLoadConfig:
     def test_no_config_returns_defaults(self, tmp_path, monkeypatch):
@@ -106,6 +123,21 @@ repositories: {}
         config = load_config(config_file)
         assert config.keep_backups == 10
 
+    def test_load_parallel_downloads(self, tmp_path):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text(
+            "settings:\n  parallelDownloads: 8\nrepositories: {}\n",
+            encoding="utf-8",
+        )
+        config = load_config(config_file)
+        assert config.parallel_downloads == 8
+
+    def test_load_hardlink_skills(self, tmp_path):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text("settings:\n  hardlinkSkills: false\n", encoding="utf-8")
+        assert load_config(config_file).hardlink_skills is False
+        assert AppConfig().hardlink_skills is True
+
     def test_missing_url_raises(self, tmp_path):
         config_file = tmp_path / "agent-skills-config.yaml"
         config_file.write_text(
@@ -126,6 +158,20 @@ repositories:
         with pytest.raises(ConfigError, match="Invalid YAML"):
             load_config(config_file)
 
+    def test_non_utf8_config_raises_config_error(self, tmp_path):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_bytes(b"settings:\n  backupPath: \xff\xfe\n")
+        with pytest.raises(ConfigError, match="Invalid YAML"):
+            load_config(config_file)
+
+    def test_non_ascii_values_roundtrip(self, tmp_path):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text(
+            "repositories:\n  org/ré:\n    url: https://github.com/org/re\n",
+            encoding="utf-8",
+        )
+        assert load_config(config_file).repositories[0].name == "org/ré"
+
     def test_explicit_nonexistent_path_raises(self, tmp_path):
         with pytest.raises(ConfigError, match="Config file not found"):
             load_config(tmp_path / "nonexistent.yaml")
@@ -142,3 +188,107 @@ repositories:
         assert len(paths) == 2
         assert config.global_skills_path in paths
         assert config.windsurf_skills_path in paths
+
+
+class TestConfigCache:
+    def test_unchanged_file_skips_parsing(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text("settings:\n  keepBackups: 7\n", encoding="utf-8")
+        first = _load_config_cached(config_file)
+
+        def _fail(path):
+            raise AssertionError("config was reparsed")
+
+        monkeypatch.setattr("agent_skills_updater.config._read_config_data", _fail)
+        second = _load_config_cached(config_file)
+        assert second == first
+        assert second.keep_backups == 7
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text("settings:\n  keepBackups: 7\n", encoding="utf-8")
+        assert _load_config_cached(config_file).keep_backups == 7
+
+        config_file.write_text("settings:\n  keepBackups: 12\n", encoding="utf-8")
+        assert _load_config_cached(config_file).keep_backups == 12
+
+    def test_repeat_load_is_served_from_memory(self, tmp_path, isolated_cache_dir):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text("settings:\n  keepBackups: 7\n", encoding="utf-8")
+        first = load_config(config_file)
+
+        (isolated_cache_dir / "config.pickle").unlink()
+        assert load_config(config_file) is first
+
+        load_config.cache_clear()
+        assert load_config(config_file) is not first
+
+    def test_cached_config_is_frozen(self, tmp_path):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text("settings:\n  keepBackups: 7\n", encoding="utf-8")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            load_config(config_file).keep_backups = 1
+
+    def test_corrupt_cache_is_ignored(self, tmp_path, isolated_cache_dir):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text("settings:\n  keepBackups: 7\n", encoding="utf-8")
+        isolated_cache_dir.mkdir()
+        (isolated_cache_dir / "config.pickle").write_bytes(b"not a pickle")
+
+        assert _load_config_cached(config_file).keep_backups == 7
+
+    def test_cache_from_other_schema_is_reparsed(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text("settings:\n  keepBackups: 7\n", encoding="utf-8")
+        _load_config_cached(config_file)
+        load_config.cache_clear()
+
+        parsed = []
+        real_parse = config_module._read_config_data
+
+        def _parse(path):
+            parsed.append(path)
+            return real_parse(path)
+
+        monkeypatch.setattr(config_module, "_CACHE_SCHEMA", config_module._CACHE_SCHEMA + 1)
+        monkeypatch.setattr(config_module, "_read_config_data", _parse)
+        assert _load_config_cached(config_file).keep_backups == 7
+        assert parsed == [config_file]
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_cached_paths_follow_repointed_symlink(self, tmp_path, monkeypatch):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        link = tmp_path / "link"
+        link.symlink_to("a")
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text(f"settings:\n  globalSkillsPath: {link}\n", encoding="utf-8")
+        assert _load_config_cached(config_file).global_skills_path == tmp_path.resolve() / "a"
+
+        link.unlink()
+        link.symlink_to("b")
+        load_config.cache_clear()
+
+        def _fail(path):
+            raise AssertionError("config was reparsed")
+
+        monkeypatch.setattr(config_module, "_read_config_data", _fail)
+        assert _load_config_cached(config_file).global_skills_path == tmp_path.resolve() / "b"
+
+
+class TestSaveAllowedHost:
+    def test_persists_host(self, tmp_path):
+        config_file = tmp_path / "agent-skills-config.yaml"
+        config_file.write_text(
+            "settings:\n  keepBackups: 2\nrepositories:\n  a/b:\n    url: https://gitlab.com/a/b.git\n",
+            encoding="utf-8",
+        )
+        config = load_config(config_file)
+
+        save_allowed_host(config, "gitlab.com")
+
+        assert config.allowed_hosts == ["gitlab.com"]
+        reloaded = load_config(config_file)
+        assert reloaded.allowed_hosts == ["gitlab.com"]
+        assert reloaded.keep_backups == 2
+        assert reloaded.repositories[0].name == "a/b"
@@ -0,0 +1,255 @@
+"""Tests for repository downloading."""
+
+import io
+import shutil
+import subprocess
+import time
+import zipfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from agent_skills_updater import downloader
+from agent_skills_updater.config import AppConfig, RepoConfig
+
+
+class TestGetSession:
+    def test_session_is_shared(self):
+        assert downloader._get_session() is downloader._get_session()
+
+    def test_https_adapter_retries(self):
+        adapter = downloader._get_session().get_adapter("https://github.com")
+        assert adapter.max_retries.total == 3
+
+    def test_pool_grows_to_requested_size(self, monkeypatch):
+        monkeypatch.setattr(downloader, "_SESSION", None)
+        monkeypatch.setattr(downloader, "_SESSION_POOL", 0)
+
+        session = downloader._get_session()
+        assert downloader._get_session(pool_size=16) is session
+        assert downloader._get_session(pool_size=4) is session
+
+        adapter = session.get_adapter("https://github.com")
+        assert adapter._pool_maxsize == 16
+
+
+def _zip_bytes(files: dict[str, str]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+class FakeContext:
+    """Minimal context for testing."""
+
+    def __init__(self, *, verbose=False):
+        self.verbose = verbose
+        self.trust_all = False
+        self.jobs = None
+
+        from rich.console import Console
+
+        self.console = Console(quiet=True)
+
+
+class TestArchiveDownload:
+    def _mock_response(self, data: bytes) -> MagicMock:
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [data[:10], data[10:]]
+        return response
+
+    def test_extracts_and_flattens(self, tmp_path, monkeypatch):
+        data = _zip_bytes({"repo-main/skills/a/SKILL.md": "# A", "repo-main/README.md": "hi"})
+        session = MagicMock()
+        session.get.return_value = self._mock_response(data)
+        monkeypatch.setattr(downloader, "_get_session", lambda: session)
+
+        repo = RepoConfig(name="org/repo", url="https://github.com/org/repo.git")
+        dest = tmp_path / "work" / "dest"
+        downloader._archive_download(repo, dest, FakeContext())
+
+        session.get.assert_called_once_with(
+            "https://github.com/org/repo/archive/refs/heads/main.zip", timeout=60, stream=True
+        )
+        assert (dest / "skills" / "a" / "SKILL.md").read_text() == "# A"
+        assert (dest / "README.md").read_text() == "hi"
+        assert not (dest / "repo-main").exists()
+        # The staging directory is gone
+        assert [p.name for p in dest.parent.iterdir()] == ["dest"]
+
+    def test_replaces_empty_destination(self, tmp_path, monkeypatch):
+        data = _zip_bytes({"repo-dev/SKILL.md": "# Root"})
+        session = MagicMock()
+        session.get.return_value = self._mock_response(data)
+        monkeypatch.setattr(downloader, "_get_session", lambda: session)
+
+        repo = RepoConfig(name="org/repo", url="https://github.com/org/repo", branch="dev")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        downloader._archive_download(repo, dest, FakeContext())
+
+        assert (dest / "SKILL.md").read_text() == "# Root"
+
+    def test_bad_zip_raises(self, tmp_path, monkeypatch):
+        session = MagicMock()
+        session.get.return_value = self._mock_response(b"definitely not a zip archive")
+        monkeypatch.setattr(downloader, "_get_session", lambda: session)
+
+        repo = RepoConfig(name="org/repo", url="https://github.com/org/repo.git")
+        with pytest.raises(downloader.DownloadError, match="Failed to extract"):
+            downloader._archive_download(repo, tmp_path / "dest", FakeContext())
+        assert list(tmp_path.iterdir()) == []
+
+    def test_non_github_rejected(self, tmp_path):
+        repo = RepoConfig(name="org/repo", url="https://gitlab.com/org/repo.git")
+        with pytest.raises(downloader.DownloadError, match="only supports GitHub"):
+            downloader._archive_download(repo, tmp_path / "dest", FakeContext())
+
+
+class TestExtractHost:
+    def test_https_url(self):
+        assert downloader._extract_host("https://gitlab.com/org/repo.git") == "gitlab.com"
+
+    def test_scp_style_url(self):
+        assert downloader._extract_host("git@github.com:org/repo.git") == "github.com"
+
+    def test_github_detection(self):
+        assert downloader._is_github_url("https://www.github.com/org/repo")
+        assert not downloader._is_github_url("https://example.com/org/repo")
+
+
+class TestCheckHostAllowed:
+    def test_listed_host_allowed_without_prompt(self):
+        config = AppConfig(allowed_hosts=["gitlab.com"])
+        url = "https://gitlab.com/org/repo.git"
+        assert downloader._check_host_allowed(url, config, FakeContext())
+        assert downloader._check_host_allowed(url, config, FakeContext(), {"gitlab.com"})
+
+    def test_always_extends_allowed_set(self, monkeypatch):
+        config = AppConfig()
+        allowed: set[str] = set()
+        monkeypatch.setattr("click.prompt", lambda *args, **kwargs: "always")
+
+        assert downloader._check_host_allowed(
+            "https://gitlab.com/org/repo.git", config, FakeContext(), allowed
+        )
+        assert allowed == {"gitlab.com"}
+
+
+class TestGitVersion:
+    def test_parses_version(self, monkeypatch):
+        downloader._git_version.cache_clear()
+        completed = MagicMock(returncode=0, stdout="git version 2.45.1.windows.1\n")
+        monkeypatch.setattr(downloader.subprocess, "run", MagicMock(return_value=completed))
+        try:
+            assert downloader._git_version() == (2, 45, 1)
+            assert downloader._is_git_available() is True
+        finally:
+            downloader._git_version.cache_clear()
+
+    def test_missing_git(self, monkeypatch):
+        downloader._git_version.cache_clear()
+        monkeypatch.setattr(
+            downloader.subprocess, "run", MagicMock(side_effect=FileNotFoundError)
+        )
+        try:
+            assert downloader._git_version() is None
+            assert downloader._is_git_available() is False
+        finally:
+            downloader._git_version.cache_clear()
+
+
+def _git(*args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.email=t@example.com", "-c", "user.name=t", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitClone:
+    def test_multi_structure_checks_out_only_configured_skills(self, tmp_path):
+        origin = tmp_path / "origin"
+        for name in ("sub-a", "sub-b", "sub-c"):
+            (origin / name).mkdir(parents=True)
+            (origin / name / "SKILL.md").write_text(f"# {name}", encoding="utf-8")
+        _git("init", "-q", "-b", "main", str(origin))
+        _git("-C", str(origin), "add", "-A")
+        _git("-C", str(origin), "commit", "-q", "-m", "init")
+
+        repo = RepoConfig(
+            name="org/repo", url=origin.as_uri(), skills=["sub-a", "sub-c"], structure="multi"
+        )
+        dest = tmp_path / "clone"
+        downloader._git_clone(repo, dest, FakeContext())
+
+        assert (dest / "sub-a" / "SKILL.md").is_file()
+        assert (dest / "sub-c" / "SKILL.md").is_file()
+        if (downloader._git_version() or ()) >= downloader._SPARSE_CHECKOUT_MIN_GIT:
+            assert not (dest / "sub-b").exists()
+
+    def test_failed_clone_reports_stderr(self, tmp_path):
+        repo = RepoConfig(name="org/missing", url=(tmp_path / "missing").as_uri())
+
+        with pytest.raises(downloader.DownloadError, match="git clone failed: .+"):
+            downloader._git_clone(repo, tmp_path / "clone", FakeContext())
+
+
+class TestDownloadRepos:
+    def test_skill_filter_skips_unrelated_repos(self, tmp_path, monkeypatch):
+        downloaded = []
+
+        def fake_download(repo, temp_dir, config, ctx, git_available):
+            downloaded.append(repo.name)
+            return downloader.DownloadResult(
+                repo=repo, local_path=temp_dir / repo.safe_name, success=True
+            )
+
+        monkeypatch.setattr(downloader, "_is_git_available", lambda: True)
+        monkeypatch.setattr(downloader, "_download_one", fake_download)
+        config = AppConfig(
+            temp_path=tmp_path / "tmp",
+            repositories=[
+                RepoConfig(name="org/a", url="https://github.com/org/a", skills=["one"]),
+                RepoConfig(name="org/b", url="https://github.com/org/b", skills=["two"]),
+            ],
+        )
+
+        results = downloader.download_repos(config, FakeContext(), skill_filter=["two"])
+
+        assert downloaded == ["org/b"]
+        assert [r.repo.name for r in results] == ["org/b"]
+        assert downloader.download_repos(config, FakeContext(), skill_filter=["nope"]) == []
+
+    def test_repos_sharing_a_directory_download_serially(self, tmp_path, monkeypatch):
+        events = []
+
+        def fake_download(repo, temp_dir, config, ctx, git_available):
+            events.append(("start", repo.name))
+            time.sleep(0.05)
+            events.append(("end", repo.name))
+            return downloader.DownloadResult(
+                repo=repo, local_path=temp_dir / repo.safe_name, success=True
+            )
+
+        monkeypatch.setattr(downloader, "_is_git_available", lambda: True)
+        monkeypatch.setattr(downloader, "_download_one", fake_download)
+        config = AppConfig(
+            temp_path=tmp_path / "tmp",
+            parallel_downloads=4,
+            repositories=[
+                RepoConfig(name="org/a", url="https://github.com/org/a"),
+                RepoConfig(name="org_a", url="https://github.com/org_/a"),
+            ],
+        )
+
+        results = downloader.download_repos(config, FakeContext())
+
+        assert events == [
+            ("start", "org/a"), ("end", "org/a"), ("start", "org_a"), ("end", "org_a"),
+        ]
+        assert [r.repo.name for r in results] == ["org/a", "org_a"]
@@ -1,12 +1,28 @@
 """Tests for skill installer."""
 
+import dataclasses
+import errno
+import os
 from pathlib import Path
 
+import pytest
+
+from agent_skills_updater import installer
 from agent_skills_updater.config import AppConfig, RepoConfig
 from agent_skills_updater.downloader import DownloadResult
 from agent_skills_updater.installer import InstalledSkill, install_skills
 
 
+class _NullConsole:
+    """Stand-in for rich's Console that discards output without initializing rich."""
+
+    def print(self, *args, **kwargs):
+        pass
+
+    def log(self, *args, **kwargs):
+        pass
+
+
 class FakeContext:
     """Minimal context for testing."""
 
@@ -16,10 +32,7 @@ class FakeContext:
         self.verbose = verbose
         self.json_output = False
         self._messages = []
-
-        from rich.console import Console
-
-        self.console = Console(quiet=True)
+        self.console = _NullConsole()
 
 
 def _make_config(tmp_path: Path) -> AppConfig:
@@ -52,6 +65,153 @@ class TestInstallSkillsStandard:
         assert installed[0].name == "test-skill"
         assert (config.global_skills_path / "test-skill" / "SKILL.md").is_file()
 
+    def test_installed_files_share_source_data(self, tmp_path):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        config = _make_config(tmp_path)
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        install_skills(config, [result], FakeContext())
+
+        source = repo_dir / "skills" / "test-skill" / "SKILL.md"
+        installed = config.global_skills_path / "test-skill" / "SKILL.md"
+        assert installed.read_text() == "# Test Skill"
+        # Same filesystem, so the file is hardlinked rather than copied
+        assert os.path.samefile(source, installed)
+
+    def test_copies_when_hardlinks_disabled(self, tmp_path):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        config = dataclasses.replace(_make_config(tmp_path), hardlink_skills=False)
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        install_skills(config, [result], FakeContext())
+
+        source = repo_dir / "skills" / "test-skill" / "SKILL.md"
+        installed = config.global_skills_path / "test-skill" / "SKILL.md"
+        assert installed.read_text() == "# Test Skill"
+        assert not os.path.samefile(source, installed)
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    @pytest.mark.parametrize("hardlink", [True, False])
+    def test_relative_symlink_is_installed_as_file(self, tmp_path, hardlink):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        (repo_dir / "skills" / "test-skill" / "link.md").symlink_to("SKILL.md")
+        config = dataclasses.replace(_make_config(tmp_path), hardlink_skills=hardlink)
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        assert len(install_skills(config, [result], FakeContext())) == 1
+
+        installed = config.global_skills_path / "test-skill" / "link.md"
+        assert not installed.is_symlink()
+        assert installed.read_text() == "# Test Skill"
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_dangling_symlink_raises(self, tmp_path):
+        skill_dir = tmp_path / "skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# Skill", encoding="utf-8")
+        (skill_dir / "gone.md").symlink_to("missing.md")
+
+        with pytest.raises(FileNotFoundError):
+            installer._clone_tree(skill_dir, tmp_path / "dest")
+
+    def test_falls_back_to_copy_when_link_fails(self, tmp_path, monkeypatch):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        config = _make_config(tmp_path)
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        def no_link(src, dst):
+            raise OSError(errno.EXDEV, "cross-device link")
+
+        monkeypatch.setattr(installer.os, "link", no_link)
+        install_skills(config, [result], FakeContext())
+
+        source = repo_dir / "skills" / "test-skill" / "SKILL.md"
+        copied = config.global_skills_path / "test-skill" / "SKILL.md"
+        assert copied.read_text() == "# Test Skill"
+        assert not os.path.samefile(source, copied)
+        assert copied.stat().st_mtime == source.stat().st_mtime
+
+    def test_copy_without_copy_file_range(self, tmp_path, monkeypatch):
+        src = tmp_path / "src.txt"
+        src.write_bytes(b"x" * 4096)
+        dst = tmp_path / "dst.txt"
+        monkeypatch.setattr(installer, "_HAS_COPY_FILE_RANGE", False)
+
+        installer._copy_file(str(src), str(dst))
+
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_copy_file_range_reporting_eof_falls_back(self, tmp_path, monkeypatch):
+        src = tmp_path / "src.txt"
+        src.write_bytes(b"x" * 4096)
+        dst = tmp_path / "dst.txt"
+        monkeypatch.setattr(installer, "_HAS_FICLONE", False)
+        monkeypatch.setattr(installer, "_HAS_COPY_FILE_RANGE", True)
+        monkeypatch.setattr(installer.os, "copy_file_range", lambda *args: 0, raising=False)
+
+        installer._copy_file(str(src), str(dst))
+
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_installs_into_every_target(self, tmp_path):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        config = _make_config(tmp_path)
+        config.windsurf_skills_path.mkdir()
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        installed = install_skills(config, [result], FakeContext())
+
+        assert len(installed) == 1
+        for target in config.skill_target_paths:
+            assert (target / "test-skill" / "SKILL.md").is_file()
+
+    def test_nested_tree_is_replicated(self, tmp_path):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        skill_dir = repo_dir / "skills" / "test-skill"
+        (skill_dir / "references" / "deep").mkdir(parents=True)
+        (skill_dir / "references" / "deep" / "notes.md").write_text("deep", encoding="utf-8")
+        (skill_dir / "scripts").mkdir()
+        (skill_dir / "scripts" / "run.sh").write_text("echo hi", encoding="utf-8")
+        config = _make_config(tmp_path)
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        install_skills(config, [result], FakeContext())
+
+        installed = config.global_skills_path / "test-skill"
+        assert sorted(p.relative_to(installed).as_posix() for p in installed.rglob("*")) == [
+            "SKILL.md",
+            "references",
+            "references/deep",
+            "references/deep/notes.md",
+            "scripts",
+            "scripts/run.sh",
+        ]
+        dirs, _, _ = installer._plan_tree(skill_dir)
+        assert dirs.index("references") < dirs.index(os.path.join("references", "deep"))
+
+    def test_missing_global_path_is_created(self, tmp_path):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        config = AppConfig(
+            global_skills_path=tmp_path / "new" / "skills",
+            windsurf_skills_path=tmp_path / "absent",
+        )
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        install_skills(config, [result], FakeContext(dry_run=True))
+        assert not config.global_skills_path.exists()
+
+        installed = install_skills(config, [result], FakeContext())
+        assert len(installed) == 1
+        assert (config.global_skills_path / "test-skill" / "SKILL.md").is_file()
+        assert not config.windsurf_skills_path.exists()
+
     def test_skip_existing_without_force(self, tmp_path):
         repo_dir = _make_standard_repo(tmp_path, "test-skill")
         config = _make_config(tmp_path)
@@ -68,6 +228,21 @@ class TestInstallSkillsStandard:
         # Original content preserved
         assert (existing / "SKILL.md").read_text() == "# Old"
 
+    def test_skipped_skill_is_not_walked(self, tmp_path, monkeypatch):
+        repo_dir = _make_standard_repo(tmp_path, "test-skill")
+        config = _make_config(tmp_path)
+        for target in config.skill_target_paths:
+            (target / "test-skill").mkdir(parents=True)
+
+        def _fail(source_dir):
+            raise AssertionError("source was walked")
+
+        monkeypatch.setattr(installer, "_plan_tree", _fail)
+        repo = RepoConfig(name="test/repo", url="https://example.com", skills=["test-skill"])
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        assert install_skills(config, [result], FakeContext(force=False)) == []
+
     def test_overwrite_with_force(self, tmp_path):
         repo_dir = _make_standard_repo(tmp_path, "test-skill")
         config = _make_config(tmp_path)
@@ -163,6 +338,75 @@ class TestInstallSkillsStructures:
 
         installed = install_skills(config, [result], FakeContext())
         assert len(installed) == 2
+        assert installed[0].installed_at == installed[1].installed_at
+        assert installed[0].updated_at == installed[0].installed_at
+
+    def test_mixed_structures_in_one_run(self, tmp_path):
+        root_repo = tmp_path / "root-repo"
+        root_repo.mkdir()
+        (root_repo / "SKILL.md").write_text("# Root", encoding="utf-8")
+        multi_repo = tmp_path / "multi-repo"
+        (multi_repo / "sub-a").mkdir(parents=True)
+        (multi_repo / "sub-a" / "SKILL.md").write_text("# A", encoding="utf-8")
+
+        config = _make_config(tmp_path)
+        results = [
+            DownloadResult(
+                repo=RepoConfig(
+                    name="org/root", url="https://example.com/root",
+                    skills=["root-skill"], structure="root",
+                ),
+                local_path=root_repo,
+                success=True,
+            ),
+            DownloadResult(
+                repo=RepoConfig(
+                    name="org/multi", url="https://example.com/multi",
+                    skills=["sub-a"], structure="multi",
+                ),
+                local_path=multi_repo,
+                success=True,
+            ),
+        ]
+
+        installed = install_skills(config, results, FakeContext())
+
+        assert [(s.name, s.source, s.skill_path) for s in installed] == [
+            ("root-skill", "org/root", "."),
+            ("sub-a", "org/multi", "sub-a"),
+        ]
+        assert (config.global_skills_path / "root-skill" / "SKILL.md").read_text() == "# Root"
+
+    def test_same_skill_from_two_repos_installs_in_order(self, tmp_path):
+        results = []
+        for name in ("first", "second"):
+            skill_dir = tmp_path / name / "skills" / "shared"
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"# {name}", encoding="utf-8")
+            repo = RepoConfig(name=f"org/{name}", url="https://example.com", skills=["shared"])
+            results.append(DownloadResult(repo=repo, local_path=tmp_path / name, success=True))
+
+        config = _make_config(tmp_path)
+        installed = install_skills(config, results, FakeContext(force=True))
+
+        assert [s.source for s in installed] == ["org/first", "org/second"]
+        assert (config.global_skills_path / "shared" / "SKILL.md").read_text() == "# second"
+
+    def test_src_skills_fallback_and_missing_skill(self, tmp_path):
+        repo_dir = tmp_path / "repo"
+        skill_dir = repo_dir / "src" / "skills" / "nested"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# nested", encoding="utf-8")
+
+        config = _make_config(tmp_path)
+        repo = RepoConfig(
+            name="test/repo", url="https://example.com", skills=["nested", "absent"]
+        )
+        result = DownloadResult(repo=repo, local_path=repo_dir, success=True)
+
+        installed = install_skills(config, [result], FakeContext())
+        assert [s.name for s in installed] == ["nested"]
+        assert installed[0].skill_path == str(Path("src", "skills", "nested"))
 
 
 class TestInstalledSkill:
@@ -184,3 +428,21 @@ class TestInstalledSkill:
         )
         assert skill.installed_at != ""
         assert skill.updated_at != ""
+
+    def test_is_frozen_and_slotted(self):
+        skill = InstalledSkill(
+            name="test", source="org/repo",
+            source_url="https://example.com", skill_path="skills/test",
+        )
+        assert not hasattr(skill, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            skill.name = "other"
+
+    def test_explicit_timestamps_kept(self):
+        skill = InstalledSkill(
+            name="test", source="org/repo",
+            source_url="https://example.com", skill_path="skills/test",
+            installed_at="2020-01-01T00:00:00+00:00", updated_at="2021-01-01T00:00:00+00:00",
+        )
+        assert skill.installed_at == "2020-01-01T00:00:00+00:00"
+        assert skill.updated_at == "2021-01-01T00:00:00+00:00"
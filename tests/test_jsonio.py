@@ -0,0 +1,54 @@
+"""Tests for JSON encoding helpers."""
+
+import json
+
+import pytest
+
+from agent_skills_updater import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestDumps:
+    def test_returns_bytes_with_newline(self, backend):
+        data = jsonio.dumps({"a": 1})
+        assert isinstance(data, bytes)
+        assert data.endswith(b"\n")
+        assert json.loads(data) == {"a": 1}
+
+    def test_indent(self, backend):
+        data = jsonio.dumps({"a": {"b": 1}}, indent=True)
+        assert b'\n  "a": {\n    "b": 1' in data
+
+    def test_sort_keys(self, backend):
+        data = jsonio.dumps({"b": 1, "a": {"d": 2, "c": 3}}, indent=True, sort_keys=True)
+        assert data.index(b'"a"') < data.index(b'"b"')
+        assert data.index(b'"c"') < data.index(b'"d"')
+
+    def test_non_ascii_is_utf8(self, backend):
+        data = jsonio.dumps({"name": "skål"})
+        assert "skål".encode() in data
+
+    def test_ensure_ascii_escapes(self, backend):
+        data = jsonio.dumps({"name": "skål"}, indent=True, ensure_ascii=True)
+        assert data.isascii()
+        assert b"sk\\u00e5l" in data
+        assert data.endswith(b"\n")
+        assert json.loads(data) == {"name": "skål"}
+
+
+class TestLoads:
+    def test_roundtrip(self, backend):
+        obj = {"skills": ["a", "b"], "count": 2}
+        assert jsonio.loads(jsonio.dumps(obj, indent=True)) == obj
+
+    def test_invalid_raises_json_decode_error(self, backend):
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.loads(b"{corrupt")
@@ -1,8 +1,12 @@
 """Tests for lockfile management."""
 
 import json
+import os
+import stat
 from pathlib import Path
 
+import pytest
+
 from agent_skills_updater.config import AppConfig
 from agent_skills_updater.installer import InstalledSkill
 from agent_skills_updater.lockfile import Lockfile, load_lockfile, save_lockfile
@@ -54,6 +58,19 @@ class TestLockfile:
         assert lf.entries["test-skill"]["installedAt"] == "2025-01-01T00:00:00+00:00"
         assert lf.entries["test-skill"]["updatedAt"] != "2025-01-01T00:00:00+00:00"
 
+    def test_update_entry_uses_batch_timestamp(self):
+        lf = Lockfile()
+        for name in ("a", "b"):
+            skill = InstalledSkill(
+                name=name,
+                source="org/repo",
+                source_url="https://example.com",
+                skill_path=f"skills/{name}",
+            )
+            lf.update_entry(skill, now="2025-06-01T12:00:00+00:00")
+        assert {e["updatedAt"] for e in lf.entries.values()} == {"2025-06-01T12:00:00+00:00"}
+        assert lf.entries["a"]["installedAt"] == "2025-06-01T12:00:00+00:00"
+
     def test_to_dict(self):
         lf = Lockfile(entries={"a": {"source": "x", "sourceUrl": "y"}})
         d = lf.to_dict()
@@ -92,6 +109,21 @@ class TestLoadSaveLockfile:
         lockfile_path = tmp_path / "deep" / "path" / ".skill-lock.json"
         assert lockfile_path.is_file()
 
+    def test_unchanged_save_skips_write(self, tmp_path):
+        config = _make_config(tmp_path)
+        lf = Lockfile(entries={"a": {"source": "x"}})
+        save_lockfile(config, lf)
+        lockfile_path = tmp_path / ".skill-lock.json"
+        inode = lockfile_path.stat().st_ino
+
+        save_lockfile(config, lf)
+        # Atomic writes replace the file; an untouched file keeps its inode
+        assert lockfile_path.stat().st_ino == inode
+
+        lf.entries["b"] = {"source": "y"}
+        save_lockfile(config, lf)
+        assert "b" in load_lockfile(config).entries
+
     def test_load_corrupt_json_returns_empty(self, tmp_path):
         config = _make_config(tmp_path)
         lockfile_path = tmp_path / ".skill-lock.json"
@@ -99,6 +131,19 @@ class TestLoadSaveLockfile:
         lf = load_lockfile(config)
         assert lf.entries == {}
 
+    def test_load_invalid_utf8_returns_empty(self, tmp_path):
+        config = _make_config(tmp_path)
+        (tmp_path / ".skill-lock.json").write_bytes(b'{"skills": {"\xff": {}}}')
+        assert load_lockfile(config).entries == {}
+
+    def test_load_coerces_non_string_values(self, tmp_path):
+        config = _make_config(tmp_path)
+        (tmp_path / ".skill-lock.json").write_text(
+            json.dumps({"skills": {"a": {"source": "x", "pinned": True}, "b": "bad"}}),
+            encoding="utf-8",
+        )
+        assert load_lockfile(config).entries == {"a": {"source": "x", "pinned": "True"}}
+
     def test_atomic_write(self, tmp_path):
         """Verify no partial writes — lockfile should be valid JSON after save."""
         config = _make_config(tmp_path)
@@ -109,3 +154,51 @@ class TestLoadSaveLockfile:
         data = json.loads(lockfile_path.read_text(encoding="utf-8"))
         assert data["version"] == 1
         assert "a" in data["skills"]
+
+    def test_save_leaves_no_temp_files(self, tmp_path):
+        config = _make_config(tmp_path)
+        save_lockfile(config, Lockfile(entries={"a": {"source": "x"}}))
+
+        names = [p.name for p in tmp_path.iterdir()]
+        assert sorted(names) == [".skill-lock.json", "skills"]
+
+    def test_save_without_o_tmpfile(self, tmp_path, monkeypatch):
+        monkeypatch.delattr(os, "O_TMPFILE", raising=False)
+        config = _make_config(tmp_path)
+        save_lockfile(config, Lockfile(entries={"a": {"source": "x"}}))
+
+        assert "a" in load_lockfile(config).entries
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".skill-lock.json", "skills"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    @pytest.mark.parametrize("o_tmpfile", [True, False])
+    def test_save_is_owner_only(self, tmp_path, monkeypatch, o_tmpfile):
+        if not o_tmpfile:
+            monkeypatch.delattr(os, "O_TMPFILE", raising=False)
+        config = _make_config(tmp_path)
+        save_lockfile(config, Lockfile(entries={"a": {"source": "x"}}))
+
+        mode = (tmp_path / ".skill-lock.json").stat().st_mode
+        assert stat.S_IMODE(mode) == 0o600
+
+    def test_save_syncs_before_rename(self, tmp_path, monkeypatch):
+        config = _make_config(tmp_path)
+        events = []
+        real_fsync, real_replace = os.fsync, Path.replace
+
+        def fsync(fd):
+            events.append("fsync")
+            real_fsync(fd)
+
+        def replace(self, target):
+            events.append("replace")
+            return real_replace(self, target)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        monkeypatch.setattr(Path, "replace", replace)
+
+        save_lockfile(config, Lockfile(entries={"a": {"source": "x"}}))
+
+        # The temp file is synced before the rename, the directory (POSIX) after it
+        expected = ["fsync", "replace"] if os.name == "nt" else ["fsync", "replace", "fsync"]
+        assert events == expected
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import time
 from unittest.mock import MagicMock, patch
 
 from agent_skills_updater.updater import (
+    _CHECK_CACHE_TTL,
+    _check_cache_file,
+    _get,
     _version_tuple,
     check_for_update,
     run_self_update,
@@ -26,28 +31,28 @@ class TestVersionTuple:
         assert _version_tuple("1.0.0") > _version_tuple("0.99.99")
         assert _version_tuple("0.1.8") == _version_tuple("0.1.8")
 
+    def test_repeat_calls_are_cached(self):
+        _version_tuple.cache_clear()
+        first = _version_tuple("3.2.1")
+        assert _version_tuple("3.2.1") is first
+        assert _version_tuple.cache_info().hits == 1
+
 
 class TestCheckForUpdate:
-    @patch("agent_skills_updater.updater.requests.get")
+    @patch("agent_skills_updater.updater._get")
     def test_newer_version_available(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"info": {"version": "99.0.0"}}
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
+        mock_get.return_value = {"info": {"version": "99.0.0"}}
 
         current, latest, needs_update = check_for_update()
 
         assert latest == "99.0.0"
         assert needs_update is True
 
-    @patch("agent_skills_updater.updater.requests.get")
+    @patch("agent_skills_updater.updater._get")
     def test_already_up_to_date(self, mock_get):
         from agent_skills_updater import __version__
 
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"info": {"version": __version__}}
-        mock_resp.raise_for_status = MagicMock()
-        mock_get.return_value = mock_resp
+        mock_get.return_value = {"info": {"version": __version__}}
 
         current, latest, needs_update = check_for_update()
 
@@ -55,7 +60,7 @@ class TestCheckForUpdate:
         assert latest == __version__
         assert needs_update is False
 
-    @patch("agent_skills_updater.updater.requests.get")
+    @patch("agent_skills_updater.updater._get")
     def test_network_error_returns_safe_default(self, mock_get):
         mock_get.side_effect = Exception("network down")
 
@@ -64,17 +69,39 @@ class TestCheckForUpdate:
         assert latest is None
         assert needs_update is False
 
-    @patch("agent_skills_updater.updater.requests.get")
+    @patch("agent_skills_updater.updater._get")
     def test_timeout_returns_safe_default(self, mock_get):
-        import requests
-
-        mock_get.side_effect = requests.Timeout("timed out")
+        mock_get.side_effect = TimeoutError("timed out")
 
         current, latest, needs_update = check_for_update()
 
         assert latest is None
         assert needs_update is False
 
+    @patch("agent_skills_updater.updater._get")
+    def test_malformed_version_returns_safe_default(self, mock_get):
+        for bad in (None, 2, "", ["1.0"]):
+            mock_get.return_value = {"info": {"version": bad}}
+
+            current, latest, needs_update = check_for_update(use_cache=False)
+
+            assert latest is None
+            assert needs_update is False
+        assert not _check_cache_file().exists()
+
+
+class TestGet:
+    @patch("urllib.request.urlopen")
+    def test_parses_json_body(self, mock_urlopen):
+        response = MagicMock()
+        response.__enter__.return_value.read.return_value = b'{"info": {"version": "1.2.3"}}'
+        mock_urlopen.return_value = response
+
+        assert _get("https://pypi.example/json", timeout=2) == {"info": {"version": "1.2.3"}}
+        request = mock_urlopen.call_args.args[0]
+        assert request.get_header("Accept") == "application/json"
+        assert mock_urlopen.call_args.kwargs["timeout"] == 2
+
 
 class TestRunSelfUpdate:
     @patch("agent_skills_updater.updater.check_for_update")
@@ -108,6 +135,9 @@ class TestRunSelfUpdate:
         assert success is True
         assert "0.1.8" in message
         assert "0.2.0" in message
+        args = mock_run.call_args.args[0]
+        assert args[1:5] == ["-m", "pip", "install", "--upgrade"]
+        assert "--disable-pip-version-check" in args
 
     @patch("agent_skills_updater.updater.subprocess.run")
     @patch("agent_skills_updater.updater.check_for_update")
@@ -119,3 +149,49 @@ class TestRunSelfUpdate:
 
         assert success is False
         assert "error msg" in message
+
+
+class TestUpdateCheckCache:
+    @staticmethod
+    def _pypi_response(version):
+        return {"info": {"version": version}}
+
+    @patch("agent_skills_updater.updater._get")
+    def test_second_check_uses_cache(self, mock_get):
+        mock_get.return_value = self._pypi_response("99.0.0")
+
+        check_for_update()
+        _, latest, needs_update = check_for_update()
+
+        assert mock_get.call_count == 1
+        assert latest == "99.0.0"
+        assert needs_update is True
+
+    @patch("agent_skills_updater.updater._get")
+    def test_expired_cache_refetches(self, mock_get):
+        mock_get.return_value = self._pypi_response("99.0.0")
+        check_for_update()
+
+        cache_file = _check_cache_file()
+        stale = time.time() - _CHECK_CACHE_TTL - 1
+        os.utime(cache_file, (stale, stale))
+        check_for_update()
+
+        assert mock_get.call_count == 2
+
+    @patch("agent_skills_updater.updater._get")
+    def test_use_cache_false_bypasses_cache(self, mock_get):
+        mock_get.return_value = self._pypi_response("99.0.0")
+
+        check_for_update()
+        check_for_update(use_cache=False)
+
+        assert mock_get.call_count == 2
+
+    @patch("agent_skills_updater.updater._get")
+    def test_failed_check_is_not_cached(self, mock_get):
+        mock_get.side_effect = Exception("network down")
+
+        check_for_update()
+
+        assert not _check_cache_file().exists()